@@ -53,7 +53,7 @@ class AlertManager:
             SELECT c.*, cl.nom as client_nom
             FROM contrats c
             JOIN clients cl ON c.client_id = cl.id
-            WHERE c.statut = 'Actif' 
+            WHERE c.statut = 'Actif'
             AND date(c.date_fin) <= date('now', '+' || ? || ' days')
             ORDER BY c.date_fin
         """
@@ -1,7 +1,7 @@
 """
 Client Manager - Business logic for client management.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 from database.db_manager import DatabaseManager
 from database.models import Client
 from utils.validators import validate_email, validate_telephone, validate_required_field
@@ -15,13 +15,16 @@ class ClientManager:
         self.db = db_manager
     
     def get_all_clients(self, include_inactive: bool = False) -> List[Client]:
-        """Get all clients."""
-        if include_inactive:
-            query = "SELECT * FROM clients ORDER BY nom"
-        else:
-            query = "SELECT * FROM clients WHERE actif = 1 ORDER BY nom"
+        """Get all clients (only the active ones unless include_inactive)."""
+        if not include_inactive:
+            return self.get_active_clients()
         
-        rows = self.db.execute_query(query)
+        rows = self.db.execute_query("SELECT * FROM clients ORDER BY nom")
+        return [self._row_to_client(row) for row in rows]
+    
+    def get_active_clients(self) -> List[Client]:
+        """Get the active clients, filtered in SQL."""
+        rows = self.db.execute_query("SELECT * FROM clients WHERE actif = 1 ORDER BY nom")
         return [self._row_to_client(row) for row in rows]
     
     def get_client_by_id(self, client_id: int) -> Optional[Client]:
@@ -32,6 +35,19 @@ class ClientManager:
             return self._row_to_client(rows[0])
         return None
     
+    def get_clients_by_ids(self, client_ids) -> Dict[int, Client]:
+        """Get several clients in one query, keyed by ID."""
+        ids = list(client_ids)
+        clients = {}
+        # Stay below SQLite's limit on the number of bound parameters
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            query = f"SELECT * FROM clients WHERE id IN ({placeholders})"
+            for row in self.db.execute_query(query, tuple(chunk)):
+                clients[row['id']] = self._row_to_client(row)
+        return clients
+    
     def create_client(self, client: Client) -> tuple[bool, str, Optional[int]]:
         """Create new client."""
         # Validate required fields
@@ -1,7 +1,7 @@
 """
 Contact Manager - Business logic for contact management.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 from database.db_manager import DatabaseManager
 from database.models import Contact
 from utils.validators import validate_email, validate_telephone, validate_required_field
@@ -14,20 +14,57 @@ class ContactManager:
         """Initialize with database manager."""
         self.db = db_manager
     
-    def get_all_contacts(self, client_id: Optional[int] = None) -> List[Contact]:
-        """Get all contacts, optionally filtered by client."""
+    def get_all_contacts(self, client_id: Optional[int] = None, limit: Optional[int] = None,
+                         offset: int = 0) -> List[Contact]:
+        """Get all contacts, optionally filtered by client and paginated."""
+        query = """
+            SELECT co.*, cl.nom as client_nom
+            FROM contacts co
+            LEFT JOIN clients cl ON co.client_id = cl.id
+        """
+        params = []
+        
         if client_id:
-            query = "SELECT * FROM contacts WHERE client_id = ? ORDER BY nom, prenom"
-            rows = self.db.execute_query(query, (client_id,))
-        else:
-            query = "SELECT * FROM contacts ORDER BY nom, prenom"
-            rows = self.db.execute_query(query)
+            query += " WHERE co.client_id = ?"
+            params.append(client_id)
+        
+        # id makes the order stable across pages
+        query += " ORDER BY co.nom, co.prenom, co.id"
+        
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params.extend((limit, offset))
         
+        rows = self.db.execute_query(query, tuple(params))
         return [self._row_to_contact(row) for row in rows]
     
+    def get_contacts_grouped_by_client(self, client_ids) -> Dict[int, List[Contact]]:
+        """Get the contacts of several clients in one query, grouped by client ID."""
+        ids = list(client_ids)
+        grouped = {client_id: [] for client_id in ids}
+        # Stay below SQLite's limit on the number of bound parameters
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            query = f"""
+                SELECT co.*, cl.nom as client_nom
+                FROM contacts co
+                LEFT JOIN clients cl ON co.client_id = cl.id
+                WHERE co.client_id IN ({placeholders})
+                ORDER BY co.nom, co.prenom, co.id
+            """
+            for row in self.db.execute_query(query, tuple(chunk)):
+                grouped[row['client_id']].append(self._row_to_contact(row))
+        return grouped
+    
     def get_contact_by_id(self, contact_id: int) -> Optional[Contact]:
         """Get contact by ID."""
-        query = "SELECT * FROM contacts WHERE id = ?"
+        query = """
+            SELECT co.*, cl.nom as client_nom
+            FROM contacts co
+            LEFT JOIN clients cl ON co.client_id = cl.id
+            WHERE co.id = ?
+        """
         rows = self.db.execute_query(query, (contact_id,))
         if rows:
             return self._row_to_contact(rows[0])
@@ -123,5 +160,6 @@ class ContactManager:
             fonction=row['fonction'] or "",
             telephone=row['telephone'] or "",
             email=row['email'] or "",
-            notes=row['notes'] or ""
+            notes=row['notes'] or "",
+            client_nom=row['client_nom'] or ""
         )
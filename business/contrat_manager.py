@@ -4,10 +4,10 @@ Contrat Manager - Business logic for contract management.
 from typing import List, Optional
 from datetime import datetime, date, timedelta
 from database.db_manager import DatabaseManager
-from database.models import Contrat
+from database.models import Contrat, ContratRow
 from utils.validators import validate_montant, validate_date_range, validate_required_field
-from utils.constants import STATUTS_CONTRAT
-from utils.formatters import parse_date
+from utils.constants import STATUTS_CONTRAT, STATUT_ACTIF
+from utils.formatters import format_date, format_montant, parse_date
 
 
 class ContratManager:
@@ -40,6 +40,30 @@ class ContratManager:
         rows = self.db.execute_query(query, tuple(params))
         return [self._row_to_contrat(row) for row in rows]
     
+    def get_contrats_list_rows(self, statut: Optional[str] = None, alerte_only: bool = False) -> List[ContratRow]:
+        """Get the contract list projection, with display values prepared once."""
+        query = """
+            SELECT id, numero_contrat, client_id, statut, date_debut, date_fin, montant, alerte_6_mois,
+                   SUBSTR(description, 1, 100) as desc_short,
+                   LENGTH(description) > 100 as desc_truncated
+            FROM contrats
+            WHERE 1=1
+        """
+        params = []
+        
+        if statut:
+            query += " AND statut = ?"
+            params.append(statut)
+        
+        if alerte_only:
+            query += " AND alerte_6_mois = 1"
+        
+        query += " ORDER BY date_fin ASC"
+        
+        rows = self.db.execute_query(query, tuple(params))
+        today = date.today()
+        return [self._row_to_list_row(row, today) for row in rows]
+    
     def get_contrat_by_id(self, contrat_id: int) -> Optional[Contrat]:
         """Get contract by ID."""
         query = "SELECT * FROM contrats WHERE id = ?"
@@ -202,6 +226,35 @@ class ContratManager:
         
         return today <= date_fin <= six_months_from_now
     
+    def _row_to_list_row(self, row, today: date) -> ContratRow:
+        """Convert database row to ContratRow, preparing the display values."""
+        date_debut = parse_date(row['date_debut']) if row['date_debut'] else None
+        date_fin = parse_date(row['date_fin']) if row['date_fin'] else None
+        alerte_6_mois = bool(row['alerte_6_mois'])
+        
+        display_desc = row['desc_short'] or ""
+        if row['desc_truncated']:
+            display_desc += "..."
+        
+        # Days until expiration, only relevant for active contracts in alert
+        days_left = None
+        if alerte_6_mois and row['statut'] == STATUT_ACTIF and date_fin:
+            days_left = (date_fin - today).days
+        
+        return ContratRow(
+            id=row['id'],
+            numero_contrat=row['numero_contrat'],
+            client_id=row['client_id'],
+            statut=row['statut'],
+            alerte_6_mois=alerte_6_mois,
+            montant=row['montant'],
+            display_desc=display_desc,
+            days_left=days_left,
+            fmt_montant=format_montant(row['montant']),
+            fmt_date_debut=format_date(date_debut),
+            fmt_date_fin=format_date(date_fin)
+        )
+    
     def _row_to_contrat(self, row) -> Contrat:
         """Convert database row to Contrat object."""
         date_debut = parse_date(row['date_debut']) if row['date_debut'] else None
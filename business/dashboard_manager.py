@@ -0,0 +1,48 @@
+"""
+Dashboard Manager - Business logic for the dashboard KPIs.
+"""
+from typing import Dict
+from database.db_manager import DatabaseManager
+from utils.constants import NATURE_FONCTIONNEMENT, NATURE_INVESTISSEMENT
+
+
+class DashboardManager:
+    """Computes the dashboard indicators."""
+    
+    def __init__(self, db_manager: DatabaseManager):
+        """Initialize with database manager."""
+        self.db = db_manager
+    
+    def get_kpis(self, annee: int, alert_days: int = 180) -> Dict[str, float]:
+        """Get every dashboard KPI for a year in a single query."""
+        query = """
+            WITH budget_totals AS (
+                SELECT
+                    COALESCE(SUM(CASE WHEN b.nature = ? THEN b.montant_initial END), 0) as total_fonc,
+                    COALESCE(SUM(CASE WHEN b.nature = ? THEN b.montant_disponible END), 0) as disponible_fonc,
+                    COALESCE(SUM(CASE WHEN b.nature = ? THEN b.montant_initial END), 0) as total_inv,
+                    COALESCE(SUM(CASE WHEN b.nature = ? THEN b.montant_disponible END), 0) as disponible_inv
+                FROM budgets b
+                JOIN clients c ON b.client_id = c.id
+                WHERE b.annee = ?
+            )
+            SELECT
+                budget_totals.*,
+                (SELECT COUNT(*) FROM contrats WHERE statut = 'Actif') as nb_contrats_actifs,
+                (SELECT COUNT(*)
+                 FROM contrats co
+                 JOIN clients cl ON co.client_id = cl.id
+                 WHERE co.statut = 'Actif'
+                 AND date(co.date_fin) <= date('now', '+' || ? || ' days')) as nb_alertes_contrats,
+                (SELECT COUNT(*) FROM projets WHERE statut = 'En cours') as nb_projets_en_cours,
+                (SELECT COUNT(*) FROM projets
+                 WHERE statut = 'En cours' AND COALESCE(fap_redigee, 0) = 0) as nb_projets_sans_fap
+            FROM budget_totals
+        """
+        params = (
+            NATURE_FONCTIONNEMENT, NATURE_FONCTIONNEMENT,
+            NATURE_INVESTISSEMENT, NATURE_INVESTISSEMENT,
+            annee, alert_days
+        )
+        row = self.db.execute_query(query, params)[0]
+        return dict(row)
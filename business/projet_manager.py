@@ -1,6 +1,7 @@
 """
 Projet Manager - Business logic for project management.
 """
+import copy
 from typing import List, Optional, Dict
 from database.db_manager import DatabaseManager
 from database.models import Projet, InvestissementProjet, ContactSourcing, ProspectProjet
@@ -9,28 +10,46 @@ from utils.constants import STATUTS_PROJET, TYPES_INVESTISSEMENT
 from utils.formatters import parse_date
 
 
+# Filtered project lists kept by get_all_projets
+_LIST_CACHE_SIZE = 8
+
+
 class ProjetManager:
     """Manages project business logic."""
     
     def __init__(self, db_manager: DatabaseManager):
         """Initialize with database manager."""
         self.db = db_manager
+        # Project lists by filter, most recently used last; cleared by invalidate
+        self._list_cache: Dict[tuple, List[Projet]] = {}
     
     def get_all_projets(self, statut: Optional[str] = None) -> List[Projet]:
-        """Get all projects with optional status filter."""
-        query = "SELECT * FROM projets WHERE 1=1"
-        params = []
-        
-        if statut:
-            query += " AND statut = ?"
-            params.append(statut)
-        
-        query += " ORDER BY nom_projet"
-        
-        rows = self.db.execute_query(query, tuple(params))
-        return [self._row_to_projet(row) for row in rows]
+        """Get all projects with optional status filter (cached until a project changes)."""
+        key = (statut,)
+        projets = self._list_cache.pop(key, None)
+        if projets is None:
+            query = "SELECT * FROM projets WHERE 1=1"
+            params = []
+            
+            if statut:
+                query += " AND statut = ?"
+                params.append(statut)
+            
+            query += " ORDER BY nom_projet"
+            
+            rows = self.db.execute_query(query, tuple(params))
+            projets = [self._row_to_projet(row) for row in rows]
+            if len(self._list_cache) >= _LIST_CACHE_SIZE:
+                del self._list_cache[next(iter(self._list_cache))]
+        self._list_cache[key] = projets
+        # Copies, so that callers editing a project do not alter the cache
+        return [copy.copy(projet) for projet in projets]
         
         
+    def invalidate(self):
+        """Drop the cached project lists, after a project was created, updated or deleted."""
+        self._list_cache.clear()
+    
     def get_projets_by_statut(self, statut: str) -> List[Projet]:
         """Get projects by status."""
         return self.get_all_projets(statut=statut)
@@ -86,6 +105,7 @@ class ProjetManager:
                  projet.investissement_licence, projet.investissement_materiel, projet.investissement_logiciel,
                  projet.cout_formation, projet.frais_maintenance, projet.technologies_utilisees)
             )
+            self.invalidate()
             return True, "Projet créé avec succès", projet_id
         except Exception as e:
             return False, f"Erreur lors de la création: {str(e)}", None
@@ -136,6 +156,7 @@ class ProjetManager:
                  projet.investissement_licence, projet.investissement_materiel, projet.investissement_logiciel,
                  projet.cout_formation, projet.frais_maintenance, projet.technologies_utilisees, projet.id)
             )
+            self.invalidate()
             return True, "Projet mis à jour avec succès"
         except Exception as e:
             return False, f"Erreur lors de la mise à jour: {str(e)}"
@@ -146,6 +167,7 @@ class ProjetManager:
             # Delete related data (cascade will handle this)
             query = "DELETE FROM projets WHERE id = ?"
             self.db.execute_update(query, (projet_id,))
+            self.invalidate()
             return True, "Projet supprimé avec succès"
         except Exception as e:
             return False, f"Erreur lors de la suppression: {str(e)}"
@@ -157,6 +179,18 @@ class ProjetManager:
         rows = self.db.execute_query(query, (projet_id,))
         return [self._row_to_investissement(row) for row in rows]
     
+    def get_investissements_with_total(self, projet_id: int) -> tuple[List[InvestissementProjet], float]:
+        """Get all investments for a project and their total, in a single query."""
+        query = """
+            SELECT *, SUM(montant_estime) OVER () as total
+            FROM investissements_projets
+            WHERE projet_id = ?
+            ORDER BY type, description
+        """
+        rows = self.db.execute_query(query, (projet_id,))
+        total = float(rows[0]['total'] or 0) if rows else 0.0
+        return [self._row_to_investissement(row) for row in rows], total
+    
     def add_investissement(self, investissement: InvestissementProjet) -> tuple[bool, str, Optional[int]]:
         """Add investment to project."""
         if not investissement.projet_id:
@@ -229,6 +263,23 @@ class ProjetManager:
             return float(result[0]['total'])
         return 0.0
     
+    def get_totals_investissements_map(self, statut: Optional[str] = None) -> Dict[int, float]:
+        """Get total estimated investments of every project (optionally filtered by status), by project ID."""
+        query = """
+            SELECT i.projet_id, COALESCE(SUM(i.montant_estime), 0) as total
+            FROM investissements_projets i
+        """
+        params = []
+        
+        if statut:
+            query += " JOIN projets p ON i.projet_id = p.id WHERE p.statut = ?"
+            params.append(statut)
+        
+        query += " GROUP BY i.projet_id"
+        
+        rows = self.db.execute_query(query, tuple(params))
+        return {row['projet_id']: float(row['total']) for row in rows}
+    
     # Contact sourcing methods
     def get_contacts_sourcing(self, projet_id: int) -> List[ContactSourcing]:
         """Get all sourcing contacts for a project."""
@@ -271,6 +271,7 @@ class DatabaseManager:
             # Create indexes for performance
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_contrats_client ON contrats(client_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_contrats_dates ON contrats(date_debut, date_fin)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_contrats_statut_alerte ON contrats(statut, alerte_6_mois, date_fin)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_budgets_client ON budgets(client_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_budgets_annee ON budgets(annee)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_bc_client ON bons_commande(client_id)")
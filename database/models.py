@@ -2,7 +2,7 @@
 Data models for the Budget Management Application.
 """
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import NamedTuple, Optional
 from datetime import datetime, date
 
 
@@ -31,6 +31,7 @@ class Contact:
     telephone: str = ""
     email: str = ""
     notes: str = ""
+    client_nom: str = ""  # Joined from clients, read-only
 
 
 @dataclass
@@ -48,6 +49,21 @@ class Contrat:
     alerte_6_mois: bool = False
 
 
+class ContratRow(NamedTuple):
+    """Contract projection for the contract list, with display values prepared."""
+    id: int
+    numero_contrat: str
+    client_id: Optional[int]
+    statut: str
+    alerte_6_mois: bool
+    montant: float
+    display_desc: str  # Description truncated to 100 characters
+    days_left: Optional[int]  # Days until expiry when in alert
+    fmt_montant: str
+    fmt_date_debut: str
+    fmt_date_fin: str
+
+
 @dataclass
 class Budget:
     """Budget data model."""
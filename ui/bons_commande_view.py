@@ -103,6 +103,10 @@ class BonsCommandeView(ctk.CTkFrame):
         self.bcs_scroll.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
         self.bcs_scroll.grid_columnconfigure(0, weight=1)
     
+    def on_show(self):
+        """Reload the purchase orders when the cached view is shown again."""
+        self.load_bcs()
+    
     def load_bcs(self):
         """Load and display BCs."""
         # Clear existing
@@ -20,15 +20,28 @@ from utils.validators import validate_montant, validate_annee, validate_required
 class BudgetsView(ctk.CTkFrame):
     """Budgets management view."""
     
-    def __init__(self, parent, db_manager: DatabaseManager):
-        """Initialize budgets view."""
+    def __init__(self, parent, db_manager: DatabaseManager, state: Optional[dict] = None):
+        """Initialize budgets view, restoring filters and scroll from state if given."""
         super().__init__(parent, fg_color="transparent")
         self.db_manager = db_manager
         self.budget_manager = BudgetManager(db_manager)
         self.client_manager = ClientManager(db_manager)
         
         self.create_widgets()
+        if state:
+            self.year_filter.set(state["year"])
+            self.nature_filter.set(state["nature"])
         self.load_budgets()
+        if state:
+            self.budgets_scroll._parent_canvas.yview_moveto(state["scroll"])
+    
+    def dump_state(self) -> dict:
+        """Return the filters and scroll position to restore in a new instance."""
+        return {
+            "year": self.year_filter.get(),
+            "nature": self.nature_filter.get(),
+            "scroll": self.budgets_scroll._parent_canvas.yview()[0],
+        }
     
     def create_widgets(self):
         """Create view widgets."""
@@ -112,6 +125,10 @@ class BudgetsView(ctk.CTkFrame):
         self.budgets_scroll.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
         self.budgets_scroll.grid_columnconfigure(0, weight=1)
     
+    def on_show(self):
+        """Refresh the budgets (validated purchase orders change them) when shown again."""
+        self.load_budgets()
+    
     def load_budgets(self):
         """Load and display budgets."""
         # Clear existing
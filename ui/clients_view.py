@@ -84,6 +84,10 @@ class ClientsView(ctk.CTkFrame):
         self.clients_scroll.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
         self.clients_scroll.grid_columnconfigure(0, weight=1)
     
+    def on_show(self):
+        """Reload the clients when the cached view is shown again."""
+        self.load_clients()
+    
     def load_clients(self):
         """Load and display clients."""
         # Clear existing
@@ -0,0 +1,120 @@
+"""
+Canvas List - Liste défilante dessinée sur un tk.Canvas.
+"""
+import customtkinter as ctk
+import tkinter as tk
+from typing import Callable, Optional
+from utils.constants import COLOR_BG_DARK
+
+
+class CanvasList(ctk.CTkFrame):
+    """Vertical list drawn on a plain tk.Canvas with a CTkScrollbar.
+    
+    Rows are placed with place_row (create_window) instead of being packed,
+    so scrolling only moves the canvas view. on_scroll is called whenever
+    the visible area changes (scrollbar, mouse wheel or resize).
+    """
+    
+    def __init__(self, parent, on_scroll: Optional[Callable[[], None]] = None):
+        """Initialize the canvas, its scrollbar and the wheel bindings."""
+        super().__init__(parent, fg_color="transparent")
+        self.on_scroll = on_scroll
+        self._content_height = 0
+        
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        
+        self.canvas = tk.Canvas(
+            self,
+            bg=COLOR_BG_DARK,
+            highlightthickness=0,
+            bd=0,
+            yscrollincrement=20
+        )
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        
+        self.canvas.bind("<Configure>", self._on_configure)
+        # Wheel events go to the row under the pointer, so listen globally
+        # and keep only those coming from inside the canvas (removed in destroy)
+        self._wheel_bindings = [
+            (sequence, self.bind_all(sequence, self._on_mousewheel, add="+"))
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>")
+        ]
+    
+    def destroy(self):
+        """Remove this list's global wheel handlers, keeping the other ones, then destroy it."""
+        for sequence, funcid in self._wheel_bindings:
+            script = self.tk.call("bind", "all", sequence)
+            kept = "\n".join(line for line in script.split("\n") if funcid not in line)
+            self.tk.call("bind", "all", sequence, kept)
+            self.deletecommand(funcid)
+        self._wheel_bindings = []
+        super().destroy()
+    
+    def clear(self):
+        """Remove every item and scroll back to the top."""
+        self.canvas.delete("all")
+        self.canvas.yview_moveto(0)
+        self.set_content_height(0)
+    
+    def set_content_height(self, height: int):
+        """Set the total scrollable height of the list."""
+        self._content_height = height
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), height))
+    
+    def place_row(self, y: int, widget, height: int) -> int:
+        """Place a widget across the full width at y and return its item id."""
+        return self.canvas.create_window(
+            0, y,
+            anchor="nw",
+            window=widget,
+            width=self.canvas.winfo_width(),
+            height=height,
+            tags="row"
+        )
+    
+    def show_message(self, text: str, font, fill: str = "gray50"):
+        """Show a centered message, e.g. when the list is empty."""
+        self.canvas.create_text(
+            self.canvas.winfo_width() // 2, 50,
+            text=text,
+            font=font,
+            fill=fill,
+            anchor="n",
+            justify="center",
+            tags="message"
+        )
+    
+    def _notify_scroll(self):
+        """Tell the owner that the visible area changed."""
+        if self.on_scroll:
+            self.on_scroll()
+    
+    def _on_configure(self, event):
+        """Stretch rows to the new width and re-center the message."""
+        self.canvas.itemconfigure("row", width=event.width)
+        self.canvas.coords("message", event.width // 2, 50)
+        self.canvas.configure(scrollregion=(0, 0, event.width, self._content_height))
+        self._notify_scroll()
+    
+    def _on_scrollbar(self, *args):
+        """Scroll from the scrollbar."""
+        self.canvas.yview(*args)
+        self._notify_scroll()
+    
+    def _on_mousewheel(self, event):
+        """Scroll with the mouse wheel when the pointer is over the list."""
+        if not str(event.widget).startswith(str(self.canvas)):
+            return
+        if event.num == 4:
+            step = -3
+        elif event.num == 5:
+            step = 3
+        else:
+            step = -3 if event.delta > 0 else 3
+        self.canvas.yview_scroll(step, "units")
+        self._notify_scroll()
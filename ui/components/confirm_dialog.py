@@ -0,0 +1,72 @@
+"""
+Confirm Dialog - Boîte de confirmation Oui/Non réutilisable.
+"""
+import customtkinter as ctk
+import tkinter as tk
+from utils.constants import COLOR_PRIMARY, COLOR_DANGER
+
+
+class ConfirmDialog(ctk.CTkToplevel):
+    """Yes/No confirmation built once and hidden between uses.
+    
+    ask() shows it with a new title and message and blocks until the user answers.
+    """
+    
+    def __init__(self, parent):
+        """Create the dialog widgets, hidden."""
+        super().__init__(parent)
+        self.withdraw()
+        self.result = False
+        # Set when the user answers; the dialog is hidden, not destroyed
+        self.closed = tk.BooleanVar(value=False)
+        
+        self.resizable(False, False)
+        self.transient(parent)
+        self.protocol("WM_DELETE_WINDOW", lambda: self._answer(False))
+        self.bind("<Return>", lambda e: self._answer(True))
+        self.bind("<Escape>", lambda e: self._answer(False))
+        
+        self.message_label = ctk.CTkLabel(self, text="", justify="left", anchor="w", wraplength=420)
+        self.message_label.pack(fill="x", padx=20, pady=(20, 15))
+        
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.pack(fill="x", padx=20, pady=(0, 20))
+        
+        self.no_btn = ctk.CTkButton(
+            btn_frame,
+            text="Non",
+            command=lambda: self._answer(False),
+            width=100,
+            fg_color="gray40",
+            hover_color="gray50"
+        )
+        self.no_btn.pack(side="right", padx=5)
+        
+        self.yes_btn = ctk.CTkButton(
+            btn_frame,
+            text="Oui",
+            command=lambda: self._answer(True),
+            width=100,
+            fg_color=COLOR_DANGER,
+            hover_color=COLOR_PRIMARY
+        )
+        self.yes_btn.pack(side="right", padx=5)
+    
+    def ask(self, title: str, message: str) -> bool:
+        """Show the question and wait for the answer (True for Oui)."""
+        self.title(title)
+        self.message_label.configure(text=message)
+        self.result = False
+        self.closed.set(False)
+        self.deiconify()
+        self.grab_set()
+        self.yes_btn.focus_set()
+        self.wait_variable(self.closed)
+        return self.result
+    
+    def _answer(self, result: bool):
+        """Record the answer and hide the dialog."""
+        self.result = result
+        self.grab_release()
+        self.withdraw()
+        self.closed.set(True)
@@ -0,0 +1,233 @@
+"""
+Contact Dialog - Formulaire de création/modification d'un contact.
+"""
+import customtkinter as ctk
+import dataclasses
+from typing import Optional
+from database.db_manager import DatabaseManager
+from business.contact_manager import ContactManager
+from business.client_manager import ClientManager
+from database.models import Contact
+from utils.constants import COLOR_PRIMARY, COLOR_SUCCESS
+from utils.validators import validate_email, validate_telephone, validate_required_field
+
+
+class ContactDialog(ctk.CTkToplevel):
+    """Dialog for creating/editing contacts."""
+    
+    def __init__(self, parent, db_manager: DatabaseManager, contact_manager: ContactManager,
+                 client_manager: ClientManager, contact: Optional[Contact] = None, title: str = "Contact"):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        # Managers are shared with the parent view
+        self.contact_manager = contact_manager
+        self.client_manager = client_manager
+        self.contact = contact
+        self.result = None
+        
+        self.title(title)
+        self.geometry("500x600")
+        self.resizable(False, False)
+        
+        # Make dialog modal
+        self.transient(parent)
+        self.grab_set()
+        
+        self.create_widgets()
+        
+        if contact:
+            self.populate_data()
+    
+    def create_widgets(self):
+        """Create dialog widgets."""
+        # Main frame
+        main_frame = ctk.CTkScrollableFrame(self, fg_color="transparent")
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        # Client (optional)
+        ctk.CTkLabel(main_frame, text="Client", anchor="w").pack(fill="x", pady=(0, 5))
+        self.client_combo = ctk.CTkComboBox(main_frame, values=["Aucun"])
+        self.client_combo.set("Aucun")
+        self.client_combo.pack(fill="x", pady=(0, 15))
+        self.client_combo.client_map = {}
+        # Clients are fetched when the user first reaches the combobox
+        self._clients_loaded = False
+        self.client_combo.bind("<Enter>", self._load_clients)
+        self.client_combo.bind("<FocusIn>", self._load_clients)
+        
+        # Nom
+        ctk.CTkLabel(main_frame, text="Nom *", anchor="w").pack(fill="x", pady=(0, 5))
+        self.nom_entry = ctk.CTkEntry(main_frame, placeholder_text="Nom de famille")
+        self.nom_entry.pack(fill="x", pady=(0, 15))
+        
+        # Prenom
+        ctk.CTkLabel(main_frame, text="Prénom *", anchor="w").pack(fill="x", pady=(0, 5))
+        self.prenom_entry = ctk.CTkEntry(main_frame, placeholder_text="Prénom")
+        self.prenom_entry.pack(fill="x", pady=(0, 15))
+        
+        # Fonction
+        ctk.CTkLabel(main_frame, text="Fonction", anchor="w").pack(fill="x", pady=(0, 5))
+        self.fonction_entry = ctk.CTkEntry(main_frame, placeholder_text="Poste/Fonction")
+        self.fonction_entry.pack(fill="x", pady=(0, 15))
+        
+        # Telephone
+        ctk.CTkLabel(main_frame, text="Téléphone", anchor="w").pack(fill="x", pady=(0, 5))
+        self.tel_entry = ctk.CTkEntry(main_frame, placeholder_text="01 23 45 67 89")
+        self.tel_entry.pack(fill="x", pady=(0, 15))
+        
+        # Email
+        ctk.CTkLabel(main_frame, text="Email", anchor="w").pack(fill="x", pady=(0, 5))
+        self.email_entry = ctk.CTkEntry(main_frame, placeholder_text="email@exemple.com")
+        self.email_entry.pack(fill="x", pady=(0, 15))
+        
+        # Notes
+        ctk.CTkLabel(main_frame, text="Notes", anchor="w").pack(fill="x", pady=(0, 5))
+        self.notes_text = ctk.CTkTextbox(main_frame, height=100)
+        self.notes_text.pack(fill="x", pady=(0, 15))
+        
+        # Buttons
+        btn_container = ctk.CTkFrame(self, fg_color="transparent")
+        btn_container.pack(fill="x", padx=20, pady=(0, 20))
+        
+        btn_frame = ctk.CTkFrame(btn_container, fg_color="transparent")
+        btn_frame.pack(fill="x")
+        
+        cancel_btn = ctk.CTkButton(
+            btn_frame,
+            text="Annuler",
+            command=self.destroy,
+            width=100,
+            fg_color="gray40",
+            hover_color="gray50"
+        )
+        cancel_btn.pack(side="right", padx=5)
+        
+        save_btn = ctk.CTkButton(
+            btn_frame,
+            text="Enregistrer",
+            command=self.save,
+            width=100,
+            fg_color=COLOR_SUCCESS,
+            hover_color=COLOR_PRIMARY
+        )
+        save_btn.pack(side="right", padx=5)
+    
+    def _load_clients(self, event=None):
+        """Fill the client combobox with active clients on first use."""
+        if self._clients_loaded:
+            return
+        self._clients_loaded = True
+        
+        client_names = ["Aucun"]
+        client_map = {}
+        for c in self.client_manager.get_all_clients():
+            if c.actif:
+                client_names.append(c.nom)
+                client_map[c.nom] = c.id
+        self.client_combo.configure(values=client_names)
+        self.client_combo.client_map = client_map
+    
+    def populate_data(self):
+        """Populate form with contact data."""
+        if self.contact:
+            # Set client
+            if self.contact.client_id:
+                self._load_clients()
+                if self.contact.client_nom in self.client_combo.client_map:
+                    self.client_combo.set(self.contact.client_nom)
+            
+            self.nom_entry.insert(0, self.contact.nom)
+            self.prenom_entry.insert(0, self.contact.prenom)
+            
+            if self.contact.fonction:
+                self.fonction_entry.insert(0, self.contact.fonction)
+            if self.contact.telephone:
+                self.tel_entry.insert(0, self.contact.telephone)
+            if self.contact.email:
+                self.email_entry.insert(0, self.contact.email)
+            if self.contact.notes:
+                self.notes_text.insert("1.0", self.contact.notes)
+    
+    def save(self):
+        """Save the contact."""
+        from tkinter import messagebox
+        try:
+            # Get client ID
+            self._load_clients()
+            client_id = None
+            client_nom = self.client_combo.get()
+            if client_nom != "Aucun" and client_nom in self.client_combo.client_map:
+                client_id = self.client_combo.client_map[client_nom]
+            
+            # Read every entry once
+            vals = {
+                name: getattr(self, f"{name}_entry").get().strip()
+                for name in ("nom", "prenom", "fonction", "tel", "email")
+            }
+            notes = self.notes_text.get("1.0", "end-1c").strip()
+            
+            # Validate
+            for field, label in (("nom", "Nom"), ("prenom", "Prénom")):
+                valid, msg = validate_required_field(vals[field], label)
+                if not valid:
+                    messagebox.showerror("Erreur", msg)
+                    return
+            
+            if not validate_email(vals["email"]):
+                messagebox.showerror("Erreur", "Format d'email invalide")
+                return
+            
+            if not validate_telephone(vals["tel"]):
+                messagebox.showerror("Erreur", "Format de téléphone invalide")
+                return
+            
+            nom = vals["nom"]
+            prenom = vals["prenom"]
+            fonction = vals["fonction"]
+            telephone = vals["tel"]
+            email = vals["email"]
+            
+            # Create or update
+            if self.contact:
+                # Update a copy: the listed (and cached) contact keeps its values if the update fails
+                updated = dataclasses.replace(
+                    self.contact,
+                    client_id=client_id,
+                    nom=nom,
+                    prenom=prenom,
+                    fonction=fonction,
+                    telephone=telephone,
+                    email=email,
+                    notes=notes
+                )
+                
+                success, msg = self.contact_manager.update_contact(updated)
+                if success:
+                    messagebox.showinfo("Succès", msg)
+                    self.contact = updated
+                    self.result = True
+                    self.destroy()
+                else:
+                    messagebox.showerror("Erreur", msg)
+            else:
+                # Create
+                new_contact = Contact(
+                    client_id=client_id,
+                    nom=nom,
+                    prenom=prenom,
+                    fonction=fonction,
+                    telephone=telephone,
+                    email=email,
+                    notes=notes
+                )
+                
+                success, msg, contact_id = self.contact_manager.create_contact(new_contact)
+                if success:
+                    messagebox.showinfo("Succès", msg)
+                    self.result = True
+                    self.destroy()
+                else:
+                    messagebox.showerror("Erreur", msg)
+                    
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur lors de l'enregistrement:\n{e}")
@@ -2,7 +2,8 @@
 Contacts View - Gestion complète des contacts.
 """
 import customtkinter as ctk
-from tkinter import messagebox
+from collections import OrderedDict
+from functools import partial
 from typing import Optional
 from database.db_manager import DatabaseManager
 from business.contact_manager import ContactManager
@@ -12,7 +13,42 @@ from utils.constants import (
     COLOR_PRIMARY, COLOR_SUCCESS, COLOR_DANGER, COLOR_WARNING,
     COLOR_BG_CARD
 )
-from utils.validators import validate_email, validate_telephone, validate_required_field
+
+
+# Maximum number of rendered contact cards kept alive between reloads
+_CARD_CACHE_SIZE = 1024
+
+# Card text prefixes
+_PREFIX_USER = "👤 "
+_PREFIX_CLIENT = "🏢 "
+_PREFIX_FONCTION = "💼 "
+_PREFIX_TELEPHONE = "📞 "
+_PREFIX_EMAIL = "✉️ "
+_PREFIX_NOTES = "📝 "
+_NOTES_MAX_LENGTH = 150
+
+# Number of contacts rendered per page while scrolling
+_PAGE_SIZE = 40
+
+# Delay (ms) during which a second click on "Supprimer" confirms the deletion
+_DELETE_CONFIRM_DELAY = 3000
+
+# Shared fonts, created on first use because Tk needs a root window.
+_FONTS: dict[str, ctk.CTkFont] = {}
+
+
+def _fonts() -> dict[str, ctk.CTkFont]:
+    """Return the cached fonts used by the contacts view."""
+    if not _FONTS:
+        _FONTS.update(
+            header=ctk.CTkFont(size=28, weight="bold"),
+            filter=ctk.CTkFont(size=14, weight="bold"),
+            empty=ctk.CTkFont(size=16),
+            title=ctk.CTkFont(size=16, weight="bold"),
+            body=ctk.CTkFont(size=12),
+            notes=ctk.CTkFont(size=11),
+        )
+    return _FONTS
 
 
 class ContactsView(ctk.CTkFrame):
@@ -24,6 +60,20 @@ class ContactsView(ctk.CTkFrame):
         self.db_manager = db_manager
         self.contact_manager = ContactManager(db_manager)
         self.client_manager = ClientManager(db_manager)
+        self._contacts_by_id: dict[int, Contact] = {}
+        # contact_id -> (contact rendered, card), least recently shown first
+        self._card_cache: OrderedDict[int, tuple[Contact, ctk.CTkFrame]] = OrderedDict()
+        # Cards currently packed in contacts_scroll, in display order
+        self._card_widgets: list[ctk.CTkFrame] = []
+        self._no_data_label: Optional[ctk.CTkLabel] = None
+        # contact_id -> after id of the pending inline delete confirmation
+        self._pending_delete: dict[int, str] = {}
+        # Incremental loading state
+        self._all_loaded = False
+        self._load_more_pending = False
+        # Filter of the last render; _dirty forces a reload after a change
+        self._last_client_id_rendered: Optional[int] = None
+        self._dirty = True
         
         self.create_widgets()
         self.load_contacts()
@@ -42,7 +92,7 @@ class ContactsView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame,
             text="👥 Gestion des Contacts",
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=_fonts()["header"],
             text_color=COLOR_PRIMARY
         )
         title_label.grid(row=0, column=0, sticky="w")
@@ -65,25 +115,20 @@ class ContactsView(ctk.CTkFrame):
         ctk.CTkLabel(
             filter_frame,
             text="🔍 Filtres:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_fonts()["filter"]
         ).pack(side="left", padx=(10, 20))
         
         ctk.CTkLabel(filter_frame, text="Client:").pack(side="left", padx=(0, 5))
         
-        # Load clients for filter
-        clients = self.client_manager.get_all_clients()
-        client_names = ["Tous"] + [c.nom for c in clients if c.actif]
         self.client_filter = ctk.CTkComboBox(
             filter_frame,
-            values=client_names,
+            values=["Tous"],
             width=200,
             command=lambda _: self.load_contacts()
         )
         self.client_filter.set("Tous")
         self.client_filter.pack(side="left", padx=5)
-        
-        # Store client mapping
-        self.client_filter.client_map = {c.nom: c.id for c in clients if c.actif}
+        self._refresh_client_filter()
         
         # Scrollable frame for contacts
         self.contacts_scroll = ctk.CTkScrollableFrame(
@@ -93,365 +138,292 @@ class ContactsView(ctk.CTkFrame):
         )
         self.contacts_scroll.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
         self.contacts_scroll.grid_columnconfigure(0, weight=1)
+        
+        # Load the next page when the list is scrolled near its end
+        self.contacts_scroll._parent_canvas.configure(yscrollcommand=self._on_contacts_yview)
+    
+    def on_show(self):
+        """Reload the clients filter and the contacts when the cached view is shown again."""
+        self._refresh_client_filter()
+        # Client names may have changed; unchanged cards are reused from the cache
+        self._dirty = True
+        self.load_contacts()
+    
+    def _refresh_client_filter(self):
+        """Offer the current active clients in the filter, keeping the selection if it still exists."""
+        client_names = ["Tous"]
+        client_map = {}
+        for c in self.client_manager.get_all_clients():
+            if c.actif:
+                client_names.append(c.nom)
+                client_map[c.nom] = c.id
+        self.client_filter.configure(values=client_names)
+        self.client_filter.client_map = client_map
+        if self.client_filter.get() not in client_map:
+            self.client_filter.set("Tous")
     
     def load_contacts(self):
         """Load and display contacts."""
-        # Clear existing
-        for widget in self.contacts_scroll.winfo_children():
-            widget.destroy()
-        
         # Get filter
         client_filter = self.client_filter.get()
         client_id = None
         if client_filter != "Tous" and client_filter in self.client_filter.client_map:
             client_id = self.client_filter.client_map[client_filter]
         
-        # Load contacts
-        contacts = self.contact_manager.get_all_contacts(client_id=client_id)
-        
-        if not contacts:
-            no_data_label = ctk.CTkLabel(
-                self.contacts_scroll,
-                text="Aucun contact trouvé",
-                font=ctk.CTkFont(size=16),
-                text_color="gray50"
-            )
-            no_data_label.pack(pady=50)
+        # Same filter and no modification since the last render
+        if client_id == self._last_client_id_rendered and not self._dirty:
             return
+        self._last_client_id_rendered = client_id
+        self._dirty = False
+        
+        # Clear existing (widgets are hidden and kept for reuse)
+        for card in self._card_widgets:
+            card.pack_forget()
+        self._card_widgets.clear()
+        if self._no_data_label:
+            self._no_data_label.pack_forget()
+        
+        # Load the first page of contacts
+        self._contacts_by_id = {}
+        self._all_loaded = False
+        self.contacts_scroll._parent_canvas.yview_moveto(0)
+        self._load_more()
+        
+        if not self._contacts_by_id:
+            if not self._no_data_label:
+                self._no_data_label = ctk.CTkLabel(
+                    self.contacts_scroll,
+                    text="Aucun contact trouvé",
+                    font=_fonts()["empty"],
+                    text_color="gray50"
+                )
+            self._no_data_label.pack(pady=50)
+    
+    def _on_contacts_yview(self, first: str, last: str):
+        """Update the scrollbar and request the next page near the bottom."""
+        self.contacts_scroll._scrollbar.set(first, last)
+        if float(last) > 0.9 and not self._all_loaded and not self._load_more_pending:
+            self._load_more_pending = True
+            self.after_idle(self._load_more)
+    
+    def _load_more(self):
+        """Fetch and render the next page of contacts for the current filter."""
+        self._load_more_pending = False
+        if self._all_loaded:
+            return
+        
+        contacts = self.contact_manager.get_all_contacts(
+            client_id=self._last_client_id_rendered,
+            limit=_PAGE_SIZE,
+            offset=len(self._contacts_by_id)
+        )
+        if len(contacts) < _PAGE_SIZE:
+            self._all_loaded = True
+        self._contacts_by_id.update((c.id, c) for c in contacts)
+        
+        # Decide once per contact which optional rows the card shows
+        plans = [
+            (c, bool(c.client_id), bool(c.fonction), bool(c.telephone), bool(c.email), bool(c.notes))
+            for c in contacts
+        ]
+        
+        # Display contacts, reusing cached cards whose contact is unchanged
+        for plan in plans:
+            contact = plan[0]
+            cached = self._card_cache.get(contact.id)
+            if cached and cached[0] == contact:
+                card = cached[1]
+                card.pack(fill="x", pady=5, padx=5)
+                self._card_cache.move_to_end(contact.id)
+            else:
+                if cached:
+                    cached[1].destroy()
+                card = self.create_contact_card(plan)
+                self._card_cache[contact.id] = (contact, card)
+            self._card_widgets.append(card)
         
-        # Display contacts
-        for contact in contacts:
-            self.create_contact_card(contact)
+        self._evict_cards()
+    
+    def _evict_cards(self):
+        """Destroy least recently shown cards beyond the cache size."""
+        while len(self._card_cache) > _CARD_CACHE_SIZE:
+            contact_id, (_, card) = next(iter(self._card_cache.items()))
+            if contact_id in self._contacts_by_id:
+                # Only cards currently on screen remain
+                break
+            self._card_cache.popitem(last=False)
+            card.destroy()
     
-    def create_contact_card(self, contact: Contact):
-        """Create a contact card."""
+    def _invalidate_card(self, contact_id: int):
+        """Drop the cached card of a modified or deleted contact."""
+        cached = self._card_cache.pop(contact_id, None)
+        if cached:
+            if cached[1] in self._card_widgets:
+                self._card_widgets.remove(cached[1])
+            cached[1].destroy()
+    
+    def create_contact_card(self, plan: tuple[Contact, bool, bool, bool, bool, bool]) -> ctk.CTkFrame:
+        """Create a contact card from a (contact, has_client, has_fonction,
+        has_telephone, has_email, has_notes) plan built by load_contacts."""
+        contact, has_client, has_fonction, has_telephone, has_email, has_notes = plan
+        fonts = _fonts()
+        # All labels and buttons live directly in the card grid: column 0
+        # holds the text, columns 1-2 hold the action buttons.
         card = ctk.CTkFrame(self.contacts_scroll, fg_color=COLOR_BG_CARD, corner_radius=10)
         card.pack(fill="x", pady=5, padx=5)
-        
-        # Main info frame
-        info_frame = ctk.CTkFrame(card, fg_color="transparent")
-        info_frame.pack(fill="x", padx=15, pady=15)
-        info_frame.grid_columnconfigure(1, weight=1)
+        card.grid_columnconfigure(0, weight=1)
         
         # Contact name
         nom_label = ctk.CTkLabel(
-            info_frame,
-            text=f"👤 {contact.prenom} {contact.nom}",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            card,
+            text=_PREFIX_USER + contact.prenom + " " + contact.nom,
+            font=fonts["title"],
             text_color="white"
         )
-        nom_label.grid(row=0, column=0, sticky="w", columnspan=2)
+        nom_label.grid(row=0, column=0, columnspan=3, sticky="w", padx=15, pady=(15, 0))
         
-        # Get client name
-        if contact.client_id:
-            client = self.client_manager.get_client_by_id(contact.client_id)
-            client_name = client.nom if client else "Client inconnu"
-            
+        # Client
+        if has_client:
             client_label = ctk.CTkLabel(
-                info_frame,
-                text=f"🏢 {client_name}",
-                font=ctk.CTkFont(size=12),
+                card,
+                text=_PREFIX_CLIENT + (contact.client_nom or "Client inconnu"),
+                font=fonts["body"],
                 text_color="gray70"
             )
-            client_label.grid(row=1, column=0, sticky="w", columnspan=2, pady=(2, 0))
+            client_label.grid(row=1, column=0, columnspan=3, sticky="w", padx=15, pady=(2, 0))
         
         # Function
-        if contact.fonction:
+        if has_fonction:
             fonction_label = ctk.CTkLabel(
-                info_frame,
-                text=f"💼 {contact.fonction}",
-                font=ctk.CTkFont(size=12),
+                card,
+                text=_PREFIX_FONCTION + contact.fonction,
+                font=fonts["body"],
                 text_color=COLOR_PRIMARY
             )
-            fonction_label.grid(row=2, column=0, sticky="w", columnspan=2, pady=(5, 0))
-        
-        # Details frame
-        details_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-        details_frame.grid(row=3, column=0, columnspan=2, sticky="ew", pady=(10, 0))
-        details_frame.grid_columnconfigure((0, 1), weight=1)
+            fonction_label.grid(row=2, column=0, columnspan=3, sticky="w", padx=15, pady=(5, 0))
         
-        # Contact info
-        contact_info_left = []
-        contact_info_right = []
+        # Contact info (telephone and email share one label)
+        contact_info = []
         
-        if contact.telephone:
-            contact_info_left.append(f"📞 {contact.telephone}")
+        if has_telephone:
+            contact_info.append(_PREFIX_TELEPHONE + contact.telephone)
         
-        if contact.email:
-            contact_info_right.append(f"✉️ {contact.email}")
+        if has_email:
+            contact_info.append(_PREFIX_EMAIL + contact.email)
         
-        if contact_info_left:
+        if contact_info:
             ctk.CTkLabel(
-                details_frame,
-                text="\n".join(contact_info_left),
-                font=ctk.CTkFont(size=12),
+                card,
+                text="\t\t".join(contact_info),
+                font=fonts["body"],
                 text_color="white"
-            ).grid(row=0, column=0, sticky="w")
-        
-        if contact_info_right:
-            ctk.CTkLabel(
-                details_frame,
-                text="\n".join(contact_info_right),
-                font=ctk.CTkFont(size=12),
-                text_color="white"
-            ).grid(row=0, column=1, sticky="w", padx=(20, 0))
+            ).grid(row=3, column=0, columnspan=3, sticky="w", padx=15, pady=(10, 0))
         
         # Notes
-        if contact.notes:
+        if has_notes:
+            notes = contact.notes
+            if len(notes) > _NOTES_MAX_LENGTH:
+                notes = notes[:_NOTES_MAX_LENGTH] + "..."
             notes_label = ctk.CTkLabel(
-                info_frame,
-                text=f"📝 {contact.notes[:150]}{'...' if len(contact.notes) > 150 else ''}",
-                font=ctk.CTkFont(size=11),
+                card,
+                text=_PREFIX_NOTES + notes,
+                font=fonts["notes"],
                 text_color="gray60"
             )
-            notes_label.grid(row=4, column=0, columnspan=2, sticky="w", pady=(10, 0))
+            notes_label.grid(row=4, column=0, columnspan=3, sticky="w", padx=15, pady=(10, 0))
         
         # Action buttons
-        btn_frame = ctk.CTkFrame(card, fg_color="transparent")
-        btn_frame.pack(fill="x", padx=15, pady=(0, 15))
+        delete_btn = ctk.CTkButton(
+            card,
+            text="🗑️ Supprimer",
+            command=partial(self._on_delete, contact.id),
+            width=100,
+            height=28,
+            fg_color=COLOR_DANGER,
+            hover_color="#cc0000"
+        )
+        delete_btn.grid(row=5, column=1, sticky="e", padx=5, pady=15)
         
         edit_btn = ctk.CTkButton(
-            btn_frame,
+            card,
             text="✏️ Modifier",
-            command=lambda c=contact: self.show_edit_dialog(c),
+            command=partial(self._on_edit, contact.id),
             width=100,
             height=28,
             fg_color=COLOR_PRIMARY,
             hover_color=COLOR_SUCCESS
         )
-        edit_btn.pack(side="right", padx=5)
+        edit_btn.grid(row=5, column=2, sticky="e", padx=(5, 20), pady=15)
         
-        delete_btn = ctk.CTkButton(
-            btn_frame,
-            text="🗑️ Supprimer",
-            command=lambda c=contact: self.delete_contact(c),
-            width=100,
-            height=28,
-            fg_color=COLOR_DANGER,
-            hover_color="#cc0000"
+        # Store references
+        card.delete_btn = delete_btn
+        
+        return card
+    
+    def _on_edit(self, contact_id: int):
+        """Open the edit dialog for the contact displayed with this id."""
+        contact = self._contacts_by_id.get(contact_id)
+        if contact:
+            self.show_edit_dialog(contact)
+    
+    def _on_delete(self, contact_id: int):
+        """Ask for confirmation in the card, then delete on a second click."""
+        contact = self._contacts_by_id.get(contact_id)
+        if not contact:
+            return
+        
+        if contact_id in self._pending_delete:
+            self.after_cancel(self._pending_delete.pop(contact_id))
+            self.delete_contact(contact)
+            return
+        
+        cached = self._card_cache.get(contact_id)
+        if cached:
+            cached[1].delete_btn.configure(text="Confirmer?", fg_color="#880000")
+        self._pending_delete[contact_id] = self.after(
+            _DELETE_CONFIRM_DELAY, partial(self._reset_delete, contact_id)
         )
-        delete_btn.pack(side="right", padx=5)
+    
+    def _reset_delete(self, contact_id: int):
+        """Restore the delete button once the confirmation delay expires."""
+        self._pending_delete.pop(contact_id, None)
+        cached = self._card_cache.get(contact_id)
+        if cached:
+            cached[1].delete_btn.configure(text="🗑️ Supprimer", fg_color=COLOR_DANGER)
     
     def show_create_dialog(self):
         """Show dialog to create a new contact."""
-        dialog = ContactDialog(self, self.db_manager, title="Créer un Contact")
+        from ui.contact_dialog import ContactDialog
+        dialog = ContactDialog(
+            self, self.db_manager, self.contact_manager, self.client_manager,
+            title="Créer un Contact"
+        )
         dialog.wait_window()
         if dialog.result:
+            self._dirty = True
             self.load_contacts()
     
     def show_edit_dialog(self, contact: Contact):
         """Show dialog to edit a contact."""
-        dialog = ContactDialog(self, self.db_manager, contact=contact, title="Modifier le Contact")
+        from ui.contact_dialog import ContactDialog
+        dialog = ContactDialog(
+            self, self.db_manager, self.contact_manager, self.client_manager,
+            contact=contact, title="Modifier le Contact"
+        )
         dialog.wait_window()
         if dialog.result:
+            self._invalidate_card(contact.id)
+            self._dirty = True
             self.load_contacts()
     
     def delete_contact(self, contact: Contact):
-        """Delete a contact."""
-        if messagebox.askyesno(
-            "Confirmation",
-            f"Voulez-vous vraiment supprimer ce contact?\n\n"
-            f"Nom: {contact.prenom} {contact.nom}"
-        ):
-            success, msg = self.contact_manager.delete_contact(contact.id)
-            if success:
-                messagebox.showinfo("Succès", msg)
-                self.load_contacts()
-            else:
-                messagebox.showerror("Erreur", msg)
-
-
-class ContactDialog(ctk.CTkToplevel):
-    """Dialog for creating/editing contacts."""
-    
-    def __init__(self, parent, db_manager: DatabaseManager, contact: Optional[Contact] = None, title: str = "Contact"):
-        super().__init__(parent)
-        self.db_manager = db_manager
-        self.contact_manager = ContactManager(db_manager)
-        self.client_manager = ClientManager(db_manager)
-        self.contact = contact
-        self.result = None
-        
-        self.title(title)
-        self.geometry("500x600")
-        self.resizable(False, False)
-        
-        # Make dialog modal
-        self.transient(parent)
-        self.grab_set()
-        
-        self.create_widgets()
-        
-        if contact:
-            self.populate_data()
-    
-    def create_widgets(self):
-        """Create dialog widgets."""
-        # Main frame
-        main_frame = ctk.CTkScrollableFrame(self, fg_color="transparent")
-        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        # Client (optional)
-        ctk.CTkLabel(main_frame, text="Client", anchor="w").pack(fill="x", pady=(0, 5))
-        clients = self.client_manager.get_all_clients()
-        client_names = ["Aucun"] + [c.nom for c in clients if c.actif]
-        self.client_combo = ctk.CTkComboBox(main_frame, values=client_names)
-        self.client_combo.set("Aucun")
-        self.client_combo.pack(fill="x", pady=(0, 15))
-        self.client_combo.client_map = {c.nom: c.id for c in clients if c.actif}
-        
-        # Nom
-        ctk.CTkLabel(main_frame, text="Nom *", anchor="w").pack(fill="x", pady=(0, 5))
-        self.nom_entry = ctk.CTkEntry(main_frame, placeholder_text="Nom de famille")
-        self.nom_entry.pack(fill="x", pady=(0, 15))
-        
-        # Prenom
-        ctk.CTkLabel(main_frame, text="Prénom *", anchor="w").pack(fill="x", pady=(0, 5))
-        self.prenom_entry = ctk.CTkEntry(main_frame, placeholder_text="Prénom")
-        self.prenom_entry.pack(fill="x", pady=(0, 15))
-        
-        # Fonction
-        ctk.CTkLabel(main_frame, text="Fonction", anchor="w").pack(fill="x", pady=(0, 5))
-        self.fonction_entry = ctk.CTkEntry(main_frame, placeholder_text="Poste/Fonction")
-        self.fonction_entry.pack(fill="x", pady=(0, 15))
-        
-        # Telephone
-        ctk.CTkLabel(main_frame, text="Téléphone", anchor="w").pack(fill="x", pady=(0, 5))
-        self.tel_entry = ctk.CTkEntry(main_frame, placeholder_text="01 23 45 67 89")
-        self.tel_entry.pack(fill="x", pady=(0, 15))
-        
-        # Email
-        ctk.CTkLabel(main_frame, text="Email", anchor="w").pack(fill="x", pady=(0, 5))
-        self.email_entry = ctk.CTkEntry(main_frame, placeholder_text="email@exemple.com")
-        self.email_entry.pack(fill="x", pady=(0, 15))
-        
-        # Notes
-        ctk.CTkLabel(main_frame, text="Notes", anchor="w").pack(fill="x", pady=(0, 5))
-        self.notes_text = ctk.CTkTextbox(main_frame, height=100)
-        self.notes_text.pack(fill="x", pady=(0, 15))
-        
-        # Buttons
-        btn_container = ctk.CTkFrame(self, fg_color="transparent")
-        btn_container.pack(fill="x", padx=20, pady=(0, 20))
-        
-        btn_frame = ctk.CTkFrame(btn_container, fg_color="transparent")
-        btn_frame.pack(fill="x")
-        
-        cancel_btn = ctk.CTkButton(
-            btn_frame,
-            text="Annuler",
-            command=self.destroy,
-            width=100,
-            fg_color="gray40",
-            hover_color="gray50"
-        )
-        cancel_btn.pack(side="right", padx=5)
-        
-        save_btn = ctk.CTkButton(
-            btn_frame,
-            text="Enregistrer",
-            command=self.save,
-            width=100,
-            fg_color=COLOR_SUCCESS,
-            hover_color=COLOR_PRIMARY
-        )
-        save_btn.pack(side="right", padx=5)
-    
-    def populate_data(self):
-        """Populate form with contact data."""
-        if self.contact:
-            # Set client
-            if self.contact.client_id:
-                client = self.client_manager.get_client_by_id(self.contact.client_id)
-                if client and client.nom in self.client_combo.client_map:
-                    self.client_combo.set(client.nom)
-            
-            self.nom_entry.insert(0, self.contact.nom)
-            self.prenom_entry.insert(0, self.contact.prenom)
-            
-            if self.contact.fonction:
-                self.fonction_entry.insert(0, self.contact.fonction)
-            if self.contact.telephone:
-                self.tel_entry.insert(0, self.contact.telephone)
-            if self.contact.email:
-                self.email_entry.insert(0, self.contact.email)
-            if self.contact.notes:
-                self.notes_text.insert("1.0", self.contact.notes)
-    
-    def save(self):
-        """Save the contact."""
-        try:
-            # Get client ID
-            client_id = None
-            client_nom = self.client_combo.get()
-            if client_nom != "Aucun" and client_nom in self.client_combo.client_map:
-                client_id = self.client_combo.client_map[client_nom]
-            
-            # Validate
-            nom = self.nom_entry.get().strip()
-            valid, msg = validate_required_field(nom, "Nom")
-            if not valid:
-                messagebox.showerror("Erreur", msg)
-                return
-            
-            prenom = self.prenom_entry.get().strip()
-            valid, msg = validate_required_field(prenom, "Prénom")
-            if not valid:
-                messagebox.showerror("Erreur", msg)
-                return
-            
-            fonction = self.fonction_entry.get().strip()
-            telephone = self.tel_entry.get().strip()
-            email = self.email_entry.get().strip()
-            notes = self.notes_text.get("1.0", "end-1c").strip()
-            
-            # Validate email
-            if email and not validate_email(email):
-                messagebox.showerror("Erreur", "Format d'email invalide")
-                return
-            
-            # Validate telephone
-            if telephone and not validate_telephone(telephone):
-                messagebox.showerror("Erreur", "Format de téléphone invalide")
-                return
-            
-            # Create or update
-            if self.contact:
-                # Update
-                self.contact.client_id = client_id
-                self.contact.nom = nom
-                self.contact.prenom = prenom
-                self.contact.fonction = fonction
-                self.contact.telephone = telephone
-                self.contact.email = email
-                self.contact.notes = notes
-                
-                success, msg = self.contact_manager.update_contact(self.contact)
-                if success:
-                    messagebox.showinfo("Succès", msg)
-                    self.result = True
-                    self.destroy()
-                else:
-                    messagebox.showerror("Erreur", msg)
-            else:
-                # Create
-                new_contact = Contact(
-                    client_id=client_id,
-                    nom=nom,
-                    prenom=prenom,
-                    fonction=fonction,
-                    telephone=telephone,
-                    email=email,
-                    notes=notes
-                )
-                
-                success, msg, contact_id = self.contact_manager.create_contact(new_contact)
-                if success:
-                    messagebox.showinfo("Succès", msg)
-                    self.result = True
-                    self.destroy()
-                else:
-                    messagebox.showerror("Erreur", msg)
-                    
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors de l'enregistrement:\n{e}")
+        """Delete a contact (confirmation is given inline in its card)."""
+        success, msg = self.contact_manager.delete_contact(contact.id)
+        if success:
+            self._invalidate_card(contact.id)
+            self._dirty = True
+            self.load_contacts()
+        else:
+            from tkinter import messagebox
+            messagebox.showerror("Erreur", msg)
+            self._reset_delete(contact.id)
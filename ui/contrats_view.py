@@ -2,6 +2,8 @@
 Contrats View - Gestion complète des contrats.
 """
 import customtkinter as ctk
+import functools
+import tkinter as tk
 from tkinter import messagebox
 from datetime import datetime, date, timedelta
 from typing import Optional
@@ -9,28 +11,233 @@ from database.db_manager import DatabaseManager
 from business.contrat_manager import ContratManager
 from business.client_manager import ClientManager
 from business.contact_manager import ContactManager
-from database.models import Contrat
+from database.models import Client, Contact, Contrat, ContratRow
+from ui.components.canvas_list import CanvasList
 from utils.constants import (
     COLOR_PRIMARY, COLOR_SUCCESS, COLOR_DANGER, COLOR_WARNING,
-    COLOR_BG_CARD, STATUTS_CONTRAT, STATUT_ACTIF
+    COLOR_BG_CARD, COLOR_BG_DARK, STATUTS_CONTRAT, STATUT_ACTIF
 )
 from utils.formatters import format_montant, format_date, parse_date
 from utils.validators import validate_montant, validate_date_range, validate_required_field
 
 
+# Cards rendered above and below the visible part of the contract list
+_OVERSCAN = 2
+# Vertical space between two contract cards (px)
+_CARD_SPACING = 10
+# Delay before a filter change reloads the list (ms)
+_RELOAD_DELAY = 150
+
+
+@functools.lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Return a shared CTkFont (created on first use, once the Tk root exists)."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+class ContratCardCanvas(tk.Canvas):
+    """Contract card drawn with canvas primitives instead of one label per field."""
+    
+    PADDING = 15
+    RADIUS = 10
+    
+    def __init__(self, parent):
+        """Create the card canvas and its action buttons."""
+        super().__init__(parent, bg=COLOR_BG_DARK, highlightthickness=0, bd=0)
+        self._contrat: Optional[ContratRow] = None
+        self._client_name = ""
+        # Display fields of the shown contract, to skip redrawing unchanged data
+        self.snapshot: Optional[tuple] = None
+        
+        # Action buttons stay real widgets, placed on the canvas
+        self.edit_btn = ctk.CTkButton(
+            self,
+            text="✏️ Modifier",
+            width=100,
+            height=28,
+            fg_color=COLOR_PRIMARY,
+            hover_color=COLOR_SUCCESS
+        )
+        self.delete_btn = ctk.CTkButton(
+            self,
+            text="🗑️ Supprimer",
+            width=100,
+            height=28,
+            fg_color=COLOR_DANGER,
+            hover_color="#cc0000"
+        )
+        self._edit_window = self.create_window(0, 0, anchor="ne", window=self.edit_btn)
+        self._delete_window = self.create_window(0, 0, anchor="ne", window=self.delete_btn)
+        
+        self.bind("<Configure>", lambda event: self._draw())
+    
+    @classmethod
+    def required_height(cls) -> int:
+        """Height of a card showing every optional row."""
+        def line(size, weight="normal"):
+            return _font(size, weight).metrics("linespace")
+        
+        return (
+            cls.PADDING
+            + line(12, "bold")                   # alert
+            + 5 + line(16, "bold")               # number and status
+            + 2 + line(13)                       # client
+            + 10 + line(11) + line(13, "bold")   # details
+            + 10 + line(12, "bold")              # days left
+            + 10 + line(11)                      # description
+            + cls.PADDING
+            + 28 + cls.PADDING                   # buttons
+        )
+    
+    def render(self, contrat: ContratRow, client_name: str):
+        """Show a contract on the card, redrawing only if what it displays changed."""
+        self._contrat = contrat
+        self._client_name = client_name
+        snapshot = (
+            contrat.numero_contrat, contrat.statut, contrat.fmt_date_debut, contrat.fmt_date_fin,
+            contrat.fmt_montant, contrat.alerte_6_mois, contrat.days_left, contrat.display_desc,
+            client_name
+        )
+        if snapshot != self.snapshot:
+            self.snapshot = snapshot
+            self._draw()
+    
+    def _draw(self):
+        """Redraw the card for the current contract and size."""
+        self.delete("card")
+        contrat = self._contrat
+        if contrat is None:
+            return
+        
+        width = self.winfo_width()
+        height = self.winfo_height()
+        left = self.PADDING
+        right = width - self.PADDING
+        in_alert = contrat.alerte_6_mois and contrat.statut == STATUT_ACTIF
+        days_until_expiry = contrat.days_left
+        
+        # Determine card color based on alert status
+        if days_until_expiry is not None:
+            if days_until_expiry < 30:
+                card_color = "#2d1a1a"  # Dark red tint
+            elif days_until_expiry < 90:
+                card_color = "#2d2414"  # Dark orange tint
+            else:
+                card_color = "#2d2814"  # Dark yellow tint
+        else:
+            card_color = COLOR_BG_CARD
+        self._create_round_rect(0, 0, width, height, self.RADIUS, fill=card_color)
+        
+        y = self.PADDING
+        
+        # Alert indicator
+        if in_alert:
+            self._text(left, y, "⚠️ ALERTE", _font(12, "bold"), COLOR_DANGER)
+            y += _font(12, "bold").metrics("linespace")
+        
+        # Contract number and status badge
+        y += 5
+        line = _font(16, "bold").metrics("linespace")
+        self._text(left, y, f"📄 {contrat.numero_contrat}", _font(16, "bold"), "white")
+        statut_color = COLOR_SUCCESS if contrat.statut == STATUT_ACTIF else COLOR_DANGER
+        self._text(right - 5, y + line // 2, contrat.statut, _font(11), statut_color, anchor="e")
+        y += line
+        
+        # Client
+        y += 2
+        self._text(left, y, f"🏢 {self._client_name}", _font(13), "gray70")
+        y += _font(13).metrics("linespace")
+        
+        # Contract details
+        y += 10
+        center = width // 2
+        self._text(left, y, "Date Début", _font(11), "gray60")
+        self._text(center, y, "Date Fin", _font(11), "gray60", anchor="n")
+        self._text(right, y, "Montant", _font(11), "gray60", anchor="ne")
+        y += _font(11).metrics("linespace")
+        self._text(left, y, contrat.fmt_date_debut, _font(13), "white")
+        self._text(
+            center, y, contrat.fmt_date_fin,
+            _font(13, "bold" if contrat.alerte_6_mois else "normal"),
+            COLOR_DANGER if contrat.alerte_6_mois else "white",
+            anchor="n"
+        )
+        self._text(right, y, contrat.fmt_montant, _font(13, "bold"), COLOR_SUCCESS, anchor="ne")
+        y += _font(13, "bold").metrics("linespace")
+        
+        # Days until expiry (if alert)
+        if days_until_expiry is not None and days_until_expiry >= 0:
+            y += 10
+            self._text(left, y, f"⏰ Expire dans {days_until_expiry} jours", _font(12, "bold"), COLOR_WARNING)
+            y += _font(12, "bold").metrics("linespace")
+        
+        # Description
+        if contrat.display_desc:
+            y += 10
+            self._text(left, y, f"📋 {contrat.display_desc}", _font(11), "gray60")
+            y += _font(11).metrics("linespace")
+        
+        # Action buttons, right-aligned under the details
+        y += self.PADDING
+        self.edit_btn.configure(bg_color=card_color)
+        self.delete_btn.configure(bg_color=card_color)
+        self.coords(self._edit_window, right - 5, y)
+        self.coords(self._delete_window, right - 5 - self.edit_btn.winfo_reqwidth() - 10, y)
+    
+    def _text(self, x: int, y: int, text: str, font, fill: str, anchor: str = "nw"):
+        """Draw a line of text tagged as card content."""
+        self.create_text(x, y, text=text, font=font, fill=fill, anchor=anchor, tags="card")
+    
+    def _create_round_rect(self, x1: int, y1: int, x2: int, y2: int, radius: int, fill: str):
+        """Draw the rounded card background."""
+        points = (
+            x1 + radius, y1, x2 - radius, y1, x2, y1, x2, y1 + radius,
+            x2, y2 - radius, x2, y2, x2 - radius, y2, x1 + radius, y2,
+            x1, y2, x1, y2 - radius, x1, y1 + radius, x1, y1
+        )
+        self.create_polygon(points, smooth=True, fill=fill, outline="", tags="card")
+        self.tag_lower("card")
+
+
 class ContratsView(ctk.CTkFrame):
     """Contracts management view."""
     
-    def __init__(self, parent, db_manager: DatabaseManager):
-        """Initialize contracts view."""
+    def __init__(self, parent, db_manager: DatabaseManager, state: Optional[dict] = None):
+        """Initialize contracts view, restoring filters and scroll from state if given."""
         super().__init__(parent, fg_color="transparent")
         self.db_manager = db_manager
         self.contrat_manager = ContratManager(db_manager)
         self.client_manager = ClientManager(db_manager)
         self.contact_manager = ContactManager(db_manager)
         
+        # Virtualized list state
+        self._contrats: list[ContratRow] = []
+        self._rendered: dict[int, tuple[ContratCardCanvas, int]] = {}  # index -> (card, window id)
+        self._card_pool: list[ContratCardCanvas] = []  # built cards not placed on the canvas
+        self._previous_cards: dict[int, ContratCardCanvas] = {}  # contract id -> card, during a reload
+        self._card_height: Optional[int] = None
+        self._client_map: dict[int, Client] = {}  # clients of the listed contracts
+        self._active_clients: list[Client] = []  # choices of the contract dialog
+        self._refresh_clients()
+        self._reload_after: Optional[str] = None  # pending filter reload
+        self._dialog: Optional["ContratDialog"] = None  # hidden between uses
+        
         self.create_widgets()
+        if state:
+            self.statut_filter.set(state["statut"])
+            self.alerte_only_var.set(state["alerte_only"])
         self.load_contrats()
+        if state:
+            self.contrats_list.canvas.yview_moveto(state["scroll"])
+            self._render_visible()
+    
+    def dump_state(self) -> dict:
+        """Return the filters and scroll position to restore in a new instance."""
+        return {
+            "statut": self.statut_filter.get(),
+            "alerte_only": self.alerte_only_var.get(),
+            "scroll": self.contrats_list.canvas.yview()[0],
+        }
     
     def create_widgets(self):
         """Create view widgets."""
@@ -46,7 +253,7 @@ class ContratsView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame,
             text="📄 Gestion des Contrats",
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=_font(28, "bold"),
             text_color=COLOR_PRIMARY
         )
         title_label.grid(row=0, column=0, sticky="w")
@@ -80,7 +287,7 @@ class ContratsView(ctk.CTkFrame):
         ctk.CTkLabel(
             filter_frame,
             text="🔍 Filtres:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(side="left", padx=(10, 20))
         
         ctk.CTkLabel(filter_frame, text="Statut:").pack(side="left", padx=(0, 5))
@@ -88,7 +295,7 @@ class ContratsView(ctk.CTkFrame):
             filter_frame,
             values=["Tous"] + STATUTS_CONTRAT,
             width=120,
-            command=lambda _: self.load_contrats()
+            command=lambda _: self._schedule_reload()
         )
         self.statut_filter.set("Tous")
         self.statut_filter.pack(side="left", padx=5)
@@ -98,24 +305,42 @@ class ContratsView(ctk.CTkFrame):
             filter_frame,
             text="Alertes uniquement",
             variable=self.alerte_only_var,
-            command=self.load_contrats
+            command=self._schedule_reload
         )
         alerte_check.pack(side="left", padx=20)
         
-        # Scrollable frame for contracts
-        self.contrats_scroll = ctk.CTkScrollableFrame(
-            self,
-            fg_color="transparent",
-            corner_radius=0
-        )
-        self.contrats_scroll.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
-        self.contrats_scroll.grid_columnconfigure(0, weight=1)
+        # Contract list: a canvas on which only the visible cards are placed
+        self.contrats_list = CanvasList(self, on_scroll=self._render_visible)
+        self.contrats_list.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
+    
+    def on_show(self):
+        """Refresh clients and contracts when the cached view is shown again."""
+        self._refresh_clients()
+        # The reusable dialog was built with the previous client list
+        if self._dialog is not None:
+            self._dialog.destroy()
+            self._dialog = None
+        self.load_contrats()
+    
+    def _schedule_reload(self):
+        """Reload the list once the filters have stopped changing."""
+        if self._reload_after:
+            self.after_cancel(self._reload_after)
+        self._reload_after = self.after(_RELOAD_DELAY, self._reload)
+    
+    def _reload(self):
+        """Run the reload scheduled by _schedule_reload."""
+        self._reload_after = None
+        self.load_contrats()
     
     def load_contrats(self):
         """Load and display contracts."""
-        # Clear existing
-        for widget in self.contrats_scroll.winfo_children():
-            widget.destroy()
+        # Clear existing, keeping each card aside for the contract it shows
+        self._previous_cards = {
+            self._contrats[index].id: card for index, (card, _) in self._rendered.items()
+        }
+        self._rendered.clear()
+        self.contrats_list.clear()
         
         # Get filters
         statut = self.statut_filter.get()
@@ -123,202 +348,105 @@ class ContratsView(ctk.CTkFrame):
         alerte_only = self.alerte_only_var.get()
         
         # Load contracts
-        contrats = self.contrat_manager.get_all_contrats(statut=statut, alerte_only=alerte_only)
-        
-        if not contrats:
-            no_data_label = ctk.CTkLabel(
-                self.contrats_scroll,
-                text="Aucun contrat trouvé",
-                font=ctk.CTkFont(size=16),
-                text_color="gray50"
-            )
-            no_data_label.pack(pady=50)
-            return
-        
-        # Display contracts
-        for contrat in contrats:
-            self.create_contrat_card(contrat)
-    
-    def create_contrat_card(self, contrat: Contrat):
-        """Create a contract card."""
-        # Determine card color based on alert status
-        if contrat.alerte_6_mois and contrat.statut == STATUT_ACTIF and contrat.date_fin:
-            # Calculate days until expiration
-            days_until_expiry = (contrat.date_fin - date.today()).days
-            if days_until_expiry < 30:
-                card_color = "#2d1a1a"  # Dark red tint
-            elif days_until_expiry < 90:
-                card_color = "#2d2414"  # Dark orange tint
-            else:
-                card_color = "#2d2814"  # Dark yellow tint
-        else:
-            card_color = COLOR_BG_CARD
-        
-        card = ctk.CTkFrame(self.contrats_scroll, fg_color=card_color, corner_radius=10)
-        card.pack(fill="x", pady=5, padx=5)
-        
-        # Main info frame
-        info_frame = ctk.CTkFrame(card, fg_color="transparent")
-        info_frame.pack(fill="x", padx=15, pady=15)
-        info_frame.grid_columnconfigure(1, weight=1)
-        
-        # Alert indicator
-        if contrat.alerte_6_mois and contrat.statut == STATUT_ACTIF:
-            alert_label = ctk.CTkLabel(
-                info_frame,
-                text="⚠️ ALERTE",
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color=COLOR_DANGER
-            )
-            alert_label.grid(row=0, column=0, sticky="w")
-        
-        # Contract number and client
-        numero_label = ctk.CTkLabel(
-            info_frame,
-            text=f"📄 {contrat.numero_contrat}",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="white"
+        self._contrats = self.contrat_manager.get_contrats_list_rows(statut=statut, alerte_only=alerte_only)
+        self._client_map = self.client_manager.get_clients_by_ids(
+            {c.client_id for c in self._contrats if c.client_id}
         )
-        numero_label.grid(row=1, column=0, sticky="w", columnspan=2, pady=(5, 0))
-        
-        # Get client name
-        client = self.client_manager.get_client_by_id(contrat.client_id)
-        client_name = client.nom if client else "Client inconnu"
-        
-        client_label = ctk.CTkLabel(
-            info_frame,
-            text=f"🏢 {client_name}",
-            font=ctk.CTkFont(size=13),
-            text_color="gray70"
-        )
-        client_label.grid(row=2, column=0, sticky="w", columnspan=2, pady=(2, 0))
-        
-        # Status badge
-        statut_color = COLOR_SUCCESS if contrat.statut == STATUT_ACTIF else COLOR_DANGER
-        statut_label = ctk.CTkLabel(
-            info_frame,
-            text=contrat.statut,
-            font=ctk.CTkFont(size=11),
-            text_color=statut_color
-        )
-        statut_label.grid(row=1, column=2, sticky="e", padx=5)
-        
-        # Contract details
-        details_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-        details_frame.grid(row=3, column=0, columnspan=3, sticky="ew", pady=(10, 0))
-        details_frame.grid_columnconfigure((0, 1, 2), weight=1)
-        
-        # Date debut
-        ctk.CTkLabel(
-            details_frame,
-            text="Date Début",
-            font=ctk.CTkFont(size=11),
-            text_color="gray60"
-        ).grid(row=0, column=0, sticky="w")
-        
-        ctk.CTkLabel(
-            details_frame,
-            text=format_date(contrat.date_debut),
-            font=ctk.CTkFont(size=13),
-            text_color="white"
-        ).grid(row=1, column=0, sticky="w")
-        
-        # Date fin
-        ctk.CTkLabel(
-            details_frame,
-            text="Date Fin",
-            font=ctk.CTkFont(size=11),
-            text_color="gray60"
-        ).grid(row=0, column=1)
-        
-        date_fin_color = COLOR_DANGER if contrat.alerte_6_mois else "white"
-        ctk.CTkLabel(
-            details_frame,
-            text=format_date(contrat.date_fin),
-            font=ctk.CTkFont(size=13, weight="bold" if contrat.alerte_6_mois else "normal"),
-            text_color=date_fin_color
-        ).grid(row=1, column=1)
-        
-        # Montant
-        ctk.CTkLabel(
-            details_frame,
-            text="Montant",
-            font=ctk.CTkFont(size=11),
-            text_color="gray60"
-        ).grid(row=0, column=2, sticky="e")
         
-        ctk.CTkLabel(
-            details_frame,
-            text=format_montant(contrat.montant),
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color=COLOR_SUCCESS
-        ).grid(row=1, column=2, sticky="e")
+        if not self._contrats:
+            self.contrats_list.show_message("Aucun contrat trouvé", _font(16))
+        else:
+            if self._card_height is None:
+                self._card_height = ContratCardCanvas.required_height() + _CARD_SPACING
+            
+            # Display contracts
+            self.contrats_list.set_content_height(len(self._contrats) * self._card_height)
+            self._render_visible()
         
-        # Days until expiry (if alert)
-        if contrat.alerte_6_mois and contrat.date_fin and contrat.statut == STATUT_ACTIF:
-            days_left = (contrat.date_fin - date.today()).days
-            if days_left >= 0:
-                days_label = ctk.CTkLabel(
-                    info_frame,
-                    text=f"⏰ Expire dans {days_left} jours",
-                    font=ctk.CTkFont(size=12, weight="bold"),
-                    text_color=COLOR_WARNING
-                )
-                days_label.grid(row=4, column=0, columnspan=3, sticky="w", pady=(10, 0))
+        # Cards of contracts that are no longer visible go back to the pool
+        self._card_pool.extend(self._previous_cards.values())
+        self._previous_cards = {}
+    
+    def _render_visible(self):
+        """Place the cards intersecting the viewport and drop the others."""
+        count = len(self._contrats)
+        if not count or self._card_height is None:
+            return
         
-        # Description
-        if contrat.description:
-            desc_label = ctk.CTkLabel(
-                info_frame,
-                text=f"📋 {contrat.description[:100]}{'...' if len(contrat.description) > 100 else ''}",
-                font=ctk.CTkFont(size=11),
-                text_color="gray60"
+        top, bottom = self.contrats_list.canvas.yview()
+        first = max(int(top * count) - _OVERSCAN, 0)
+        last = min(int(bottom * count) + 1 + _OVERSCAN, count)
+        
+        for index in [i for i in self._rendered if not first <= i < last]:
+            card, window_id = self._rendered.pop(index)
+            self.contrats_list.canvas.delete(window_id)
+            self._card_pool.append(card)
+        
+        for index in range(first, last):
+            if index in self._rendered:
+                continue
+            card = self._acquire_card(self._contrats[index])
+            window_id = self.contrats_list.place_row(
+                index * self._card_height + _CARD_SPACING // 2,
+                card,
+                self._card_height - _CARD_SPACING
             )
-            desc_label.grid(row=5, column=0, columnspan=3, sticky="w", pady=(10, 0))
+            self._rendered[index] = (card, window_id)
+    
+    def _bind_card(self, card: ContratCardCanvas, contrat: ContratRow, client_map: dict[int, Client]):
+        """Show a contract's data in an existing card."""
+        client = client_map.get(contrat.client_id)
+        card.render(contrat, client.nom if client else "Client inconnu")
         
         # Action buttons
-        btn_frame = ctk.CTkFrame(card, fg_color="transparent")
-        btn_frame.pack(fill="x", padx=15, pady=(0, 15))
-        
-        edit_btn = ctk.CTkButton(
-            btn_frame,
-            text="✏️ Modifier",
-            command=lambda c=contrat: self.show_edit_dialog(c),
-            width=100,
-            height=28,
-            fg_color=COLOR_PRIMARY,
-            hover_color=COLOR_SUCCESS
-        )
-        edit_btn.pack(side="right", padx=5)
-        
-        delete_btn = ctk.CTkButton(
-            btn_frame,
-            text="🗑️ Supprimer",
-            command=lambda c=contrat: self.delete_contrat(c),
-            width=100,
-            height=28,
-            fg_color=COLOR_DANGER,
-            hover_color="#cc0000"
-        )
-        delete_btn.pack(side="right", padx=5)
+        card.edit_btn.configure(command=lambda c=contrat: self.show_edit_dialog(c))
+        card.delete_btn.configure(command=lambda c=contrat: self.delete_contrat(c))
+    
+    def _acquire_card(self, contrat: ContratRow) -> ContratCardCanvas:
+        """Take a card from the pool (or build one) and bind it to a contract."""
+        card = self._previous_cards.pop(contrat.id, None)
+        if card is None:
+            card = self._card_pool.pop() if self._card_pool else ContratCardCanvas(self.contrats_list.canvas)
+        self._bind_card(card, contrat, self._client_map)
+        return card
+    
+    def _refresh_clients(self):
+        """Reload the active clients offered by the contract dialog."""
+        self._active_clients = self.client_manager.get_active_clients()
+    
+    def _open_dialog(self, contrat: Optional[Contrat], title: str) -> ContratDialog:
+        """Show the contract dialog, built once and then reused, and wait until it closes."""
+        if self._dialog is None or not self._dialog.winfo_exists():
+            self._dialog = ContratDialog(
+                self, self.db_manager, contrat=contrat, clients=self._active_clients, title=title
+            )
+        else:
+            self._dialog.show(contrat, title)
+        self._dialog.wait_variable(self._dialog.closed)
+        return self._dialog
     
     def show_create_dialog(self):
         """Show dialog to create a new contract."""
-        dialog = ContratDialog(self, self.db_manager, title="Créer un Contrat")
-        dialog.wait_window()
+        dialog = self._open_dialog(None, "Créer un Contrat")
         if dialog.result:
             self.load_contrats()
     
-    def show_edit_dialog(self, contrat: Contrat):
+    def show_edit_dialog(self, row: ContratRow):
         """Show dialog to edit a contract."""
-        dialog = ContratDialog(self, self.db_manager, contrat=contrat, title="Modifier le Contrat")
-        dialog.wait_window()
+        # The list only holds a projection, load the full contract
+        contrat = self.contrat_manager.get_contrat_by_id(row.id)
+        if contrat is None:
+            messagebox.showerror("Erreur", "Ce contrat n'existe plus")
+            self.load_contrats()
+            return
+        
+        dialog = self._open_dialog(contrat, "Modifier le Contrat")
         if dialog.result:
             self.load_contrats()
     
-    def delete_contrat(self, contrat: Contrat):
+    def delete_contrat(self, contrat: ContratRow):
         """Delete a contract."""
-        client = self.client_manager.get_client_by_id(contrat.client_id)
+        client = self._client_map.get(contrat.client_id)
         client_name = client.nom if client else "Client inconnu"
         
         if messagebox.askyesno(
@@ -345,7 +473,8 @@ class ContratsView(ctk.CTkFrame):
 class ContratDialog(ctk.CTkToplevel):
     """Dialog for creating/editing contracts."""
     
-    def __init__(self, parent, db_manager: DatabaseManager, contrat: Optional[Contrat] = None, title: str = "Contrat"):
+    def __init__(self, parent, db_manager: DatabaseManager, contrat: Optional[Contrat] = None,
+                 title: str = "Contrat", clients: Optional[list[Client]] = None):
         super().__init__(parent)
         self.db_manager = db_manager
         self.contrat_manager = ContratManager(db_manager)
@@ -353,10 +482,17 @@ class ContratDialog(ctk.CTkToplevel):
         self.contact_manager = ContactManager(db_manager)
         self.contrat = contrat
         self.result = None
+        # Active clients, preloaded by the view when available
+        self.clients = clients if clients is not None else self.client_manager.get_active_clients()
+        # Contacts by client ID, filled once when the dialog opens
+        self._contact_cache: dict[int, list[Contact]] = {}
+        # Set when the dialog is closed; the dialog is hidden, not destroyed
+        self.closed = tk.BooleanVar(value=False)
         
         self.title(title)
         self.geometry("550x700")
         self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self.close)
         
         # Make dialog modal
         self.transient(parent)
@@ -367,6 +503,39 @@ class ContratDialog(ctk.CTkToplevel):
         if contrat:
             self.populate_data()
     
+    def show(self, contrat: Optional[Contrat], title: str):
+        """Reopen the hidden dialog for another contract."""
+        self._reset(contrat)
+        self.title(title)
+        self.closed.set(False)
+        self.deiconify()
+        self.grab_set()
+    
+    def close(self):
+        """Hide the dialog so that it can be reused."""
+        self.grab_release()
+        self.withdraw()
+        self.closed.set(True)
+    
+    def _reset(self, contrat: Optional[Contrat]):
+        """Clear the form, then fill it with contrat if given."""
+        self.contrat = contrat
+        self.result = None
+        
+        self.numero_entry.delete(0, "end")
+        self.client_combo.set("")
+        self.contact_combo.configure(values=["Aucun"])
+        self.contact_combo.set("Aucun")
+        self.contact_combo.contact_map = {}
+        self.statut_combo.set(STATUT_ACTIF)
+        self.date_debut_entry.delete(0, "end")
+        self.date_fin_entry.delete(0, "end")
+        self.montant_entry.delete(0, "end")
+        self.description_text.delete("1.0", "end")
+        
+        if contrat:
+            self.populate_data()
+    
     def create_widgets(self):
         """Create dialog widgets."""
         # Main frame with scrolling
@@ -380,12 +549,12 @@ class ContratDialog(ctk.CTkToplevel):
         
         # Client
         ctk.CTkLabel(main_frame, text="Client *", anchor="w").pack(fill="x", pady=(0, 5))
-        clients = self.client_manager.get_all_clients()
-        client_names = {c.nom: c.id for c in clients if c.actif}
+        client_names = {c.nom: c.id for c in self.clients if c.actif}
         self.client_combo = ctk.CTkComboBox(main_frame, values=list(client_names.keys()))
         self.client_combo.pack(fill="x", pady=(0, 15))
         self.client_combo.client_names = client_names
         self.client_combo.configure(command=self.on_client_change)
+        self._contact_cache = self.contact_manager.get_contacts_grouped_by_client(client_names.values())
         
         # Contact
         ctk.CTkLabel(main_frame, text="Contact", anchor="w").pack(fill="x", pady=(0, 5))
@@ -434,7 +603,7 @@ class ContratDialog(ctk.CTkToplevel):
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="Annuler",
-            command=self.destroy,
+            command=self.close,
             width=100,
             fg_color="gray40",
             hover_color="gray50"
@@ -455,7 +624,10 @@ class ContratDialog(ctk.CTkToplevel):
         """Update contact list when client changes."""
         if choice in self.client_combo.client_names:
             client_id = self.client_combo.client_names[choice]
-            contacts = self.contact_manager.get_all_contacts(client_id=client_id)
+            contacts = self._contact_cache.get(client_id)
+            if contacts is None:
+                contacts = self.contact_manager.get_all_contacts(client_id=client_id)
+                self._contact_cache[client_id] = contacts
             
             self.contact_combo.contact_map = {f"{c.prenom} {c.nom}": c.id for c in contacts}
             contact_values = ["Aucun"] + list(self.contact_combo.contact_map.keys())
@@ -553,7 +725,7 @@ class ContratDialog(ctk.CTkToplevel):
                 if success:
                     messagebox.showinfo("Succès", msg)
                     self.result = True
-                    self.destroy()
+                    self.close()
                 else:
                     messagebox.showerror("Erreur", msg)
             else:
@@ -573,7 +745,7 @@ class ContratDialog(ctk.CTkToplevel):
                 if success:
                     messagebox.showinfo("Succès", msg)
                     self.result = True
-                    self.destroy()
+                    self.close()
                 else:
                     messagebox.showerror("Erreur", msg)
                     
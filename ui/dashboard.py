@@ -2,19 +2,26 @@
 Dashboard View - Vue tableau de bord avec KPIs.
 """
 import customtkinter as ctk
+import functools
+import threading
+from tkinter import TclError
 from datetime import datetime
+from typing import Optional
 from database.db_manager import DatabaseManager
-from business.budget_manager import BudgetManager
-from business.contrat_manager import ContratManager
-from business.projet_manager import ProjetManager
-from business.alert_manager import AlertManager
+from business.dashboard_manager import DashboardManager
 from utils.constants import (
     COLOR_PRIMARY, COLOR_SUCCESS, COLOR_DANGER, COLOR_WARNING,
-    COLOR_BG_CARD, NATURE_FONCTIONNEMENT, NATURE_INVESTISSEMENT
+    COLOR_BG_CARD
 )
 from utils.formatters import format_montant
 
 
+@functools.lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Return a shared CTkFont (created on first use, once the Tk root exists)."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
 class DashboardView(ctk.CTkFrame):
     """Dashboard view with KPIs."""
     
@@ -24,10 +31,10 @@ class DashboardView(ctk.CTkFrame):
         self.db_manager = db_manager
         
         # Initialize managers
-        self.budget_manager = BudgetManager(db_manager)
-        self.contrat_manager = ContratManager(db_manager)
-        self.projet_manager = ProjetManager(db_manager)
-        self.alert_manager = AlertManager(db_manager)
+        self.dashboard_manager = DashboardManager(db_manager)
+        
+        # True while a background refresh is running
+        self._loading = False
         
         self.create_widgets()
         self.load_data()
@@ -44,7 +51,7 @@ class DashboardView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame,
             text="📊 Dashboard",
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=_font(28, "bold"),
             text_color=COLOR_PRIMARY
         )
         title_label.pack(side="left")
@@ -52,7 +59,7 @@ class DashboardView(ctk.CTkFrame):
         date_label = ctk.CTkLabel(
             header_frame,
             text=f"📅 {datetime.now().strftime('%d/%m/%Y')}",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color="gray70"
         )
         date_label.pack(side="left", padx=20)
@@ -107,7 +114,7 @@ class DashboardView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             card,
             text=title,
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             text_color=color
         )
         title_label.pack(pady=(20, 10))
@@ -116,7 +123,7 @@ class DashboardView(ctk.CTkFrame):
         value_label = ctk.CTkLabel(
             card,
             text="...",
-            font=ctk.CTkFont(size=36, weight="bold"),
+            font=_font(36, "bold"),
             text_color="white"
         )
         value_label.pack(pady=10)
@@ -125,7 +132,7 @@ class DashboardView(ctk.CTkFrame):
         secondary_label = ctk.CTkLabel(
             card,
             text="...",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color="gray70"
         )
         secondary_label.pack(pady=(0, 20))
@@ -136,61 +143,59 @@ class DashboardView(ctk.CTkFrame):
         
         return card
     
+    def on_show(self):
+        """Refresh the KPIs when the cached view is shown again."""
+        self.load_data()
+    
     def load_data(self):
-        """Load dashboard data."""
+        """Load dashboard data in the background, then update the cards."""
+        if self._loading:
+            return
+        self._loading = True
+        threading.Thread(target=self._fetch_then_apply, daemon=True).start()
+    
+    def _fetch_then_apply(self):
+        """Run the database queries off the UI thread and hand the results back."""
+        try:
+            results = self._fetch_data()
+        except Exception as e:
+            print(f"Erreur lors du chargement du dashboard: {e}")
+            results = None
         try:
-            # Current year
-            current_year = datetime.now().year
-            
+            self.after(0, self._apply, results)
+        except (RuntimeError, TclError):
+            # The view was destroyed while the queries were running
+            pass
+    
+    def _fetch_data(self) -> dict:
+        """Query every KPI value."""
+        return self.dashboard_manager.get_kpis(datetime.now().year, alert_days=180)
+    
+    def _apply(self, results: Optional[dict]):
+        """Update the KPI cards (UI thread)."""
+        self._loading = False
+        if results is None or not self.winfo_exists():
+            return
+        
+        nb_alertes = results["nb_alertes_contrats"]
+        nb_sans_fap = results["nb_projets_sans_fap"]
+        texts = (
             # Budget Fonctionnement
-            budgets_fonc = self.budget_manager.get_all_budgets(
-                annee=current_year,
-                nature=NATURE_FONCTIONNEMENT
-            )
-            total_fonc = sum(b.montant_initial for b in budgets_fonc)
-            disponible_fonc = sum(b.montant_disponible for b in budgets_fonc)
-            
-            self.kpi_fonctionnement.value_label.configure(
-                text=format_montant(total_fonc)
-            )
-            self.kpi_fonctionnement.secondary_label.configure(
-                text=f"Disponible: {format_montant(disponible_fonc)}"
-            )
-            
+            (self.kpi_fonctionnement.value_label, format_montant(results["total_fonc"])),
+            (self.kpi_fonctionnement.secondary_label, f"Disponible: {format_montant(results['disponible_fonc'])}"),
             # Budget Investissement
-            budgets_inv = self.budget_manager.get_all_budgets(
-                annee=current_year,
-                nature=NATURE_INVESTISSEMENT
-            )
-            total_inv = sum(b.montant_initial for b in budgets_inv)
-            disponible_inv = sum(b.montant_disponible for b in budgets_inv)
-            
-            self.kpi_investissement.value_label.configure(
-                text=format_montant(total_inv)
-            )
-            self.kpi_investissement.secondary_label.configure(
-                text=f"Disponible: {format_montant(disponible_inv)}"
-            )
-            
+            (self.kpi_investissement.value_label, format_montant(results["total_inv"])),
+            (self.kpi_investissement.secondary_label, f"Disponible: {format_montant(results['disponible_inv'])}"),
             # Contrats
-            contrats_actifs = self.contrat_manager.get_contrats_actifs()
-            alertes_contrats = self.alert_manager.get_contrats_expiring(days=180)
-            
-            self.kpi_contrats.value_label.configure(
-                text=str(len(contrats_actifs))
-            )
-            alert_text = f"⚠️ {len(alertes_contrats)} alertes" if alertes_contrats else "✅ Aucune alerte"
-            self.kpi_contrats.secondary_label.configure(text=alert_text)
-            
+            (self.kpi_contrats.value_label, str(results["nb_contrats_actifs"])),
+            (self.kpi_contrats.secondary_label, f"⚠️ {nb_alertes} alertes" if nb_alertes else "✅ Aucune alerte"),
             # Projets
-            projets_en_cours = self.projet_manager.get_projets_by_statut("En cours")
-            projets_sans_fap = [p for p in projets_en_cours if not p.fap_redigee]
-            
-            self.kpi_projets.value_label.configure(
-                text=str(len(projets_en_cours))
-            )
-            fap_text = f"📋 {len(projets_sans_fap)} sans FAP" if projets_sans_fap else "✅ Tous avec FAP"
-            self.kpi_projets.secondary_label.configure(text=fap_text)
-            
-        except Exception as e:
-            print(f"Erreur lors du chargement du dashboard: {e}")
+            (self.kpi_projets.value_label, str(results["nb_projets_en_cours"])),
+            (self.kpi_projets.secondary_label, f"📋 {nb_sans_fap} sans FAP" if nb_sans_fap else "✅ Tous avec FAP"),
+        )
+        
+        # Configure every changed label first, then redraw once
+        for label, text in texts:
+            if label.cget("text") != text:
+                label.configure(text=text)
+        self.update_idletasks()
@@ -2,28 +2,98 @@
 Main Window - Application principale avec navigation latérale.
 """
 import customtkinter as ctk
-from typing import Optional
-from database.db_manager import DatabaseManager
+import functools
+import importlib
+import threading
+from typing import TYPE_CHECKING, Optional
 from utils.constants import COLOR_PRIMARY, COLOR_BG_DARK, COLOR_BG_CARD
 
+if TYPE_CHECKING:
+    from database.db_manager import DatabaseManager
+
+
+# Views by key: (module, view class), imported on first use
+_VIEWS = {
+    "dashboard": ("ui.dashboard", "DashboardView"),
+    "budgets": ("ui.budgets_view", "BudgetsView"),
+    "contrats": ("ui.contrats_view", "ContratsView"),
+    "bons_commande": ("ui.bons_commande_view", "BonsCommandeView"),
+    "projets": ("ui.projets_view", "ProjetsView"),
+    "clients": ("ui.clients_view", "ClientsView"),
+    "contacts": ("ui.contacts_view", "ContactsView"),
+    "todo": ("ui.todo_view", "TodoView"),
+    "sauvegarde": ("ui.sauvegarde_view", "SauvegardeView"),
+}
+
+
+# Colors of the inactive and active sidebar buttons, as the (light, dark)
+# tuples CustomTkinter stores, so configure() does not have to convert them
+_NAV_INACTIVE = {"fg_color": "transparent", "text_color": ("gray70", "gray70")}
+_NAV_ACTIVE = {"fg_color": (COLOR_PRIMARY, COLOR_PRIMARY), "text_color": ("white", "white")}
+
+
+# Style shared by every sidebar button
+_NAV_BTN_STYLE = dict(
+    _NAV_INACTIVE,
+    width=210,
+    height=40,
+    hover_color=COLOR_BG_CARD,
+    anchor="w",
+    corner_radius=8
+)
+
+
+def _load_view_class(key: str):
+    """Return the view class of a sidebar entry, importing its module if needed.
+    
+    import_module also waits for a module that the prewarm thread is still importing.
+    """
+    module_path, class_name = _VIEWS[key]
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Return a shared CTkFont (created on first use, once the Tk root exists)."""
+    return ctk.CTkFont(size=size, weight=weight)
+
 
 class MainWindow(ctk.CTk):
     """Main application window with sidebar navigation."""
     
+    # Sidebar entries: (label, view key)
+    _NAV_ITEMS: tuple[tuple[str, str], ...] = (
+        ("📊 Dashboard", "dashboard"),
+        ("💰 Budgets", "budgets"),
+        ("📄 Contrats", "contrats"),
+        ("🛒 Bons de Commande", "bons_commande"),
+        ("📁 Projets", "projets"),
+        ("👥 Clients", "clients"),
+        ("👤 Contacts", "contacts"),
+        ("✅ To-Do List", "todo"),
+        ("💾 Sauvegarde", "sauvegarde"),
+    )
+    
     def __init__(self):
         """Initialize the main window."""
         super().__init__()
+        # Stay hidden while the widgets are created, so the layout is computed once
+        self.withdraw()
         
         # Window configuration
         self.title("Budget Management - Gestion Budgétaire")
         self.geometry("1400x800")
         
-        # Initialize database manager
-        self.db_manager = DatabaseManager()
+        # Database manager, opened by the first view that needs it
+        self._db_manager: Optional["DatabaseManager"] = None
         
         # Track active button
-        self.active_button = None
-        self.current_view = None
+        self.active_button: Optional[ctk.CTkButton] = None
+        self.current_view: Optional[ctk.CTkFrame] = None
+        # Views kept alive across navigation, by key
+        self._view_cache: dict[str, ctk.CTkFrame] = {}
+        # Filters/scroll of destroyed views, by view class name
+        self._view_state: dict[str, dict] = {}
         
         # Configure grid layout
         self.grid_columnconfigure(1, weight=1)
@@ -33,160 +103,197 @@ class MainWindow(ctk.CTk):
         self.create_sidebar()
         self.create_main_content_area()
         
-        # Show dashboard by default
-        self.show_dashboard()
+        # A restored backup replaces every table: rebuild the views
+        self.bind("<<RestartRequired>>", lambda event: self.invalidate())
+        
+        self.deiconify()
+        
+        # Show dashboard by default, once the empty window has been drawn
+        self.after_idle(functools.partial(self._navigate, "dashboard"))
+        
+        # Import the other views once the window is up
+        self.after(200, self._start_prewarm)
+        # Build the most used view after the dashboard, so its first click is instant
+        self.after(500, self._preconstruct, "budgets")
+    
+    @property
+    def db_manager(self) -> "DatabaseManager":
+        """Database manager, created on first access."""
+        if self._db_manager is None:
+            from database.db_manager import DatabaseManager
+            self._db_manager = DatabaseManager()
+        return self._db_manager
     
     def create_sidebar(self):
         """Create the sidebar with navigation buttons."""
         # Sidebar frame
         self.sidebar_frame = ctk.CTkFrame(self, width=250, corner_radius=0, fg_color=COLOR_BG_DARK)
         self.sidebar_frame.grid(row=0, column=0, sticky="nsew")
-        self.sidebar_frame.grid_rowconfigure(11, weight=1)
+        # Fixed width: the buttons do not need to resize the sidebar
+        self.sidebar_frame.grid_propagate(False)
         
         # Logo/Title
         self.logo_label = ctk.CTkLabel(
             self.sidebar_frame,
             text="💰 Budget Projet",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=_font(24, "bold"),
             text_color=COLOR_PRIMARY
         )
         self.logo_label.grid(row=0, column=0, padx=20, pady=(20, 40))
         
         # Navigation buttons
-        self.nav_buttons = {}
-        
-        nav_items = [
-            ("📊 Dashboard", self.show_dashboard),
-            ("💰 Budgets", self.show_budgets),
-            ("📄 Contrats", self.show_contrats),
-            ("🛒 Bons de Commande", self.show_bons_commande),
-            ("📁 Projets", self.show_projets),
-            ("👥 Clients", self.show_clients),
-            ("👤 Contacts", self.show_contacts),
-            ("✅ To-Do List", self.show_todo),
-            ("💾 Sauvegarde", self.show_sauvegarde),
-        ]
-        
-        for idx, (text, command) in enumerate(nav_items, start=1):
+        self.nav_buttons: list[ctk.CTkButton] = []
+        # Position of each view key in nav_buttons
+        self._nav_index: dict[str, int] = {}
+        
+        for idx, (text, key) in enumerate(self._NAV_ITEMS, start=1):
             btn = ctk.CTkButton(
                 self.sidebar_frame,
                 text=text,
-                command=command,
-                width=210,
-                height=40,
-                font=ctk.CTkFont(size=14),
-                fg_color="transparent",
-                text_color="gray70",
-                hover_color=COLOR_BG_CARD,
-                anchor="w",
-                corner_radius=8
+                command=functools.partial(self._navigate, key),
+                font=_font(14),
+                **_NAV_BTN_STYLE
             )
             btn.grid(row=idx, column=0, padx=20, pady=5, sticky="ew")
-            self.nav_buttons[text] = btn
+            self._nav_index[key] = len(self.nav_buttons)
+            self.nav_buttons.append(btn)
+        
+        # Empty row pushing the version label to the bottom
+        spacer_row = len(self._NAV_ITEMS) + 1
+        self.sidebar_frame.grid_rowconfigure(spacer_row, weight=1)
         
         # Version label at bottom
         version_label = ctk.CTkLabel(
             self.sidebar_frame,
             text="v1.0.0",
-            font=ctk.CTkFont(size=10),
+            font=_font(10),
             text_color="gray50"
         )
-        version_label.grid(row=12, column=0, padx=20, pady=(0, 20))
+        version_label.grid(row=spacer_row + 1, column=0, padx=20, pady=(0, 20))
     
     def create_main_content_area(self):
         """Create the main content area."""
         self.main_content = ctk.CTkFrame(self, corner_radius=0, fg_color=COLOR_BG_DARK)
         self.main_content.grid(row=0, column=1, sticky="nsew", padx=0, pady=0)
+        # Every view sits in the same cell; the visible one is raised on top
         self.main_content.grid_columnconfigure(0, weight=1)
         self.main_content.grid_rowconfigure(0, weight=1)
     
-    def clear_main_content(self):
-        """Clear the main content area."""
-        for widget in self.main_content.winfo_children():
-            widget.destroy()
+    def _start_prewarm(self):
+        """Start importing the view modules in the background."""
+        threading.Thread(target=self._prewarm, daemon=True).start()
+    
+    def _prewarm(self):
+        """Import every view module so the first click does not pay for it.
+        
+        Imports only: widgets must be built on the Tk thread.
+        """
+        for module_path, _ in _VIEWS.values():
+            try:
+                importlib.import_module(module_path)
+            except Exception as e:
+                print(f"Erreur lors du préchargement de {module_path}: {e}")
+    
+    def _preconstruct(self, key: str):
+        """Build a view into the cache without showing it."""
+        if key in self._view_cache:
+            return
+        view = self._build_view(key)
+        # New widgets are stacked on top: keep the current view visible
+        view.lower()
+    
+    def _release_current_view(self):
+        """Forget the current view, destroying it if it is no longer cached."""
+        view = self.current_view
+        if view is None:
+            return
+        if view not in self._view_cache.values():
+            self._destroy_view(view)
+        self.current_view = None
+    
+    def _destroy_view(self, view: ctk.CTkFrame):
+        """Destroy a view, keeping its state for the next instance if it provides one."""
+        dump_state = getattr(view, "dump_state", None)
+        if dump_state is not None:
+            self._view_state[type(view).__name__] = dump_state()
+        view.destroy()
+    
+    def _build_view(self, key: str) -> ctk.CTkFrame:
+        """Build a view, restoring its saved state, and add it to the cache."""
+        view_class = _load_view_class(key)
+        state = self._view_state.pop(view_class.__name__, None)
+        if state is None:
+            view = view_class(self.main_content, self.db_manager)
+        else:
+            view = view_class(self.main_content, self.db_manager, state=state)
+        view.grid(row=0, column=0, sticky="nsew")
+        self._view_cache[key] = view
+        return view
+    
+    def _navigate(self, key: str) -> None:
+        """Show a sidebar entry's view, building it on first visit and reusing it afterwards."""
+        self._release_current_view()
+        view = self._view_cache.get(key)
+        if view is None:
+            view = self._build_view(key)
+        else:
+            # Let cached views refresh data that may have changed elsewhere
+            on_show = getattr(view, "on_show", None)
+            if on_show is not None:
+                on_show()
+        view.tkraise()
+        self.current_view = view
+        self.set_active_button(key)
+    
+    def invalidate(self, key: Optional[str] = None):
+        """Drop a cached view (every cached view if key is None) so it is rebuilt on next visit."""
+        keys = [key] if key is not None else list(self._view_cache)
+        for k in keys:
+            view = self._view_cache.pop(k, None)
+            # The visible view is destroyed when the user navigates away
+            if view is not None and view is not self.current_view:
+                self._destroy_view(view)
+    
+    def destroy(self):
+        """Release the views and the database before destroying the window."""
+        for view in self._view_cache.values():
+            close = getattr(view, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    print(f"Erreur lors de la fermeture de {type(view).__name__}: {e}")
+        self._view_cache.clear()
+        self._view_state.clear()
         self.current_view = None
+        self.active_button = None
+        self.nav_buttons.clear()
+        self._nav_index.clear()
+        if self._db_manager is not None:
+            self._db_manager.close()
+            self._db_manager = None
+        super().destroy()
     
-    def set_active_button(self, button_text: str):
-        """Highlight the active navigation button."""
-        # Reset all buttons
-        for btn in self.nav_buttons.values():
-            btn.configure(fg_color="transparent", text_color="gray70")
+    def set_active_button(self, key: str):
+        """Highlight the navigation button of a view key."""
+        # Reset the previously active button only
+        if self.active_button is not None:
+            self.active_button.configure(**_NAV_INACTIVE)
         
         # Highlight active button
-        if button_text in self.nav_buttons:
-            self.nav_buttons[button_text].configure(
-                fg_color=COLOR_PRIMARY,
-                text_color="white"
-            )
-    
-    def show_dashboard(self):
-        """Show the dashboard view."""
-        from ui.dashboard import DashboardView
-        self.clear_main_content()
-        self.set_active_button("📊 Dashboard")
-        self.current_view = DashboardView(self.main_content, self.db_manager)
-        self.current_view.pack(fill="both", expand=True)
-    
-    def show_budgets(self):
-        """Show the budgets view."""
-        from ui.budgets_view import BudgetsView
-        self.clear_main_content()
-        self.set_active_button("💰 Budgets")
-        self.current_view = BudgetsView(self.main_content, self.db_manager)
-        self.current_view.pack(fill="both", expand=True)
-    
-    def show_contrats(self):
-        """Show the contracts view."""
-        from ui.contrats_view import ContratsView
-        self.clear_main_content()
-        self.set_active_button("📄 Contrats")
-        self.current_view = ContratsView(self.main_content, self.db_manager)
-        self.current_view.pack(fill="both", expand=True)
-    
-    def show_bons_commande(self):
-        """Show the purchase orders view."""
-        from ui.bons_commande_view import BonsCommandeView
-        self.clear_main_content()
-        self.set_active_button("🛒 Bons de Commande")
-        self.current_view = BonsCommandeView(self.main_content, self.db_manager)
-        self.current_view.pack(fill="both", expand=True)
-    
-    def show_projets(self):
-        """Show the projects view."""
-        from ui.projets_view import ProjetsView
-        self.clear_main_content()
-        self.set_active_button("📁 Projets")
-        self.current_view = ProjetsView(self.main_content, self.db_manager)
-        self.current_view.pack(fill="both", expand=True)
-    
-    def show_clients(self):
-        """Show the clients view."""
-        from ui.clients_view import ClientsView
-        self.clear_main_content()
-        self.set_active_button("👥 Clients")
-        self.current_view = ClientsView(self.main_content, self.db_manager)
-        self.current_view.pack(fill="both", expand=True)
-    
-    def show_contacts(self):
-        """Show the contacts view."""
-        from ui.contacts_view import ContactsView
-        self.clear_main_content()
-        self.set_active_button("👤 Contacts")
-        self.current_view = ContactsView(self.main_content, self.db_manager)
-        self.current_view.pack(fill="both", expand=True)
-    
-    def show_todo(self):
-        """Show the to-do list view."""
-        from ui.todo_view import TodoView
-        self.clear_main_content()
-        self.set_active_button("✅ To-Do List")
-        self.current_view = TodoView(self.main_content, self.db_manager)
-        self.current_view.pack(fill="both", expand=True)
-    
-    def show_sauvegarde(self):
-        """Show the backup/restore view."""
-        from ui.sauvegarde_view import SauvegardeView
-        self.clear_main_content()
-        self.set_active_button("💾 Sauvegarde")
-        self.current_view = SauvegardeView(self.main_content, self.db_manager)
-        self.current_view.pack(fill="both", expand=True)
+        idx = self._nav_index.get(key)
+        if idx is None:
+            self.active_button = None
+            return
+        btn = self.nav_buttons[idx]
+        btn.configure(**_NAV_ACTIVE)
+        self.active_button = btn
+
+
+def __getattr__(name: str):
+    """Import DatabaseManager only when it is accessed through this module."""
+    if name == "DatabaseManager":
+        from database.db_manager import DatabaseManager
+        globals()["DatabaseManager"] = DatabaseManager
+        return DatabaseManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
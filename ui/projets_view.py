@@ -2,20 +2,202 @@
 Projets View - Gestion complète des projets.
 """
 import customtkinter as ctk
-from tkinter import messagebox
+import contextlib
+import dataclasses
+import functools
+import threading
+import tkinter as tk
+from tkinter import TclError, messagebox
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Optional
 from database.db_manager import DatabaseManager
 from business.projet_manager import ProjetManager
 from database.models import Projet, InvestissementProjet, ContactSourcing
+from ui.components.canvas_list import CanvasList
+from ui.components.confirm_dialog import ConfirmDialog
 from utils.constants import (
     COLOR_PRIMARY, COLOR_SUCCESS, COLOR_DANGER, COLOR_WARNING,
     COLOR_BG_CARD, STATUTS_PROJET, TYPES_INVESTISSEMENT
 )
-from utils.formatters import format_montant, format_date, parse_date
+from utils.formatters import format_montant, format_date, parse_date, parse_montant
 from utils.validators import validate_montant, validate_required_field, validate_date_range
 
 
+# Cards rendered above and below the visible part of the project list
+_OVERSCAN = 2
+# Vertical space between two project cards (px)
+_CARD_SPACING = 10
+# Delay before a filter change reloads the list (ms)
+_RELOAD_DELAY = 150
+# Delay before the project dialog recomputes its total after a keystroke (ms)
+_TOTAL_DELAY = 150
+# Status badge colors
+_STATUT_COLORS = {
+    "En cours": COLOR_PRIMARY,
+    "Terminé": COLOR_SUCCESS,
+    "Suspendu": COLOR_DANGER
+}
+# FAP badge (text, color), indexed by fap_redigee
+_FAP_BADGES = (("⚠️ Sans FAP", COLOR_WARNING), ("📋 FAP", COLOR_SUCCESS))
+
+
+@functools.lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Return a shared CTkFont (created on first use, once the Tk root exists)."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+def _caption(parent, text: str, fg: str = "gray60") -> tk.Label:
+    """Small gray text on a card, as a plain Tk label (no CTk canvas behind it)."""
+    return tk.Label(parent, text=text, font=_font(11), fg=fg, bg=COLOR_BG_CARD)
+
+
+@contextlib.contextmanager
+def _refilling(scroll: ctk.CTkScrollableFrame):
+    """Clear and hide a packed list while it is refilled, then show it and lay it out once."""
+    scroll.pack_forget()
+    for widget in scroll.winfo_children():
+        widget.destroy()
+    try:
+        yield
+    finally:
+        scroll.pack(fill="both", expand=True, padx=10, pady=10)
+        scroll.update_idletasks()
+
+
+class ProjetCard(ctk.CTkFrame):
+    """Project card built once and filled by render, so it can show another project.
+    
+    The buttons call on_details/on_edit/on_delete with the project shown at click time.
+    """
+    
+    def __init__(self, parent, on_details: Callable[[Projet], None], on_edit: Callable[[Projet], None],
+                 on_delete: Callable[[Projet], None]):
+        """Create the card widgets, empty."""
+        super().__init__(parent, fg_color=COLOR_BG_CARD, corner_radius=10)
+        self.projet: Optional[Projet] = None
+        # Displayed fields of the shown project, to skip reconfiguring unchanged labels
+        self.snapshot: Optional[tuple] = None
+        
+        # Every widget sits directly in the card's grid: details in columns 0-2,
+        # badges and buttons in the right-hand columns
+        self.grid_columnconfigure((0, 1, 2), weight=1)
+        
+        # Project name
+        self.nom_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=_font(16, "bold"),
+            text_color="white"
+        )
+        self.nom_label.grid(row=0, column=0, columnspan=3, sticky="w", padx=(15, 0), pady=(15, 0))
+        
+        # FAP badge
+        self.fap_label = ctk.CTkLabel(self, text="", font=_font(11))
+        self.fap_label.grid(row=0, column=3, sticky="e", padx=5, pady=(15, 0))
+        
+        # Status badge
+        self.statut_label = ctk.CTkLabel(self, text="", font=_font(11))
+        self.statut_label.grid(row=0, column=4, sticky="e", padx=(5, 15), pady=(15, 0))
+        
+        # Project details: porteur, service and start date, each one label with the caption above the value
+        self.detail_labels = []
+        for column, columnspan, sticky, padx, justify in (
+            (0, 1, "w", (15, 0), "left"), (1, 1, "", 0, "center"), (2, 3, "e", (0, 15), "right")
+        ):
+            label = tk.Label(
+                self, text="", font=_font(12), fg="white", bg=COLOR_BG_CARD, justify=justify, height=2
+            )
+            label.grid(row=1, column=column, columnspan=columnspan, sticky=sticky, padx=padx, pady=(10, 0))
+            self.detail_labels.append(label)
+        
+        # Total investissements
+        self.inv_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=_font(12),
+            text_color=COLOR_SUCCESS
+        )
+        self.inv_label.grid(row=2, column=0, columnspan=5, sticky="w", padx=15, pady=(10, 0))
+        
+        # Action buttons, right-aligned
+        self.delete_btn = ctk.CTkButton(
+            self,
+            text="🗑️ Supprimer",
+            command=functools.partial(self._dispatch, on_delete),
+            width=100,
+            height=28,
+            fg_color=COLOR_DANGER,
+            hover_color="#cc0000"
+        )
+        self.delete_btn.grid(row=3, column=2, sticky="e", padx=5, pady=15)
+        
+        self.edit_btn = ctk.CTkButton(
+            self,
+            text="✏️ Modifier",
+            command=functools.partial(self._dispatch, on_edit),
+            width=100,
+            height=28,
+            fg_color=COLOR_PRIMARY,
+            hover_color=COLOR_SUCCESS
+        )
+        self.edit_btn.grid(row=3, column=3, sticky="e", padx=5, pady=15)
+        
+        self.details_btn = ctk.CTkButton(
+            self,
+            text="📋 Détails",
+            command=functools.partial(self._dispatch, on_details),
+            width=100,
+            height=28,
+            fg_color=COLOR_WARNING,
+            hover_color=COLOR_PRIMARY
+        )
+        self.details_btn.grid(row=3, column=4, sticky="e", padx=(5, 15), pady=15)
+    
+    def _dispatch(self, handler: Callable[[Projet], None]):
+        """Call a button handler with the project currently shown."""
+        handler(self.projet)
+    
+    def render(self, projet: Projet, date_debut: str, total_inv: str):
+        """Show a project on the card, with its start date and investment total already formatted.
+        
+        Missing optional fields (and a zero total, given as "") are left blank.
+        """
+        self.projet = projet
+        snapshot = (
+            projet.nom_projet, projet.fap_redigee, projet.statut, projet.porteur_projet,
+            projet.service_demandeur, date_debut, total_inv
+        )
+        if snapshot == self.snapshot:
+            return
+        self.snapshot = snapshot
+        
+        self.nom_label.configure(text=f"📁 {projet.nom_projet}")
+        
+        # FAP badge
+        fap_text, fap_color = _FAP_BADGES[bool(projet.fap_redigee)]
+        self.fap_label.configure(text=fap_text, text_color=fap_color)
+        
+        # Status badge
+        statut_color = _STATUT_COLORS.get(projet.statut, "white")
+        self.statut_label.configure(text=projet.statut, text_color=statut_color)
+        
+        # Project details
+        details = (
+            ("👤 Porteur", projet.porteur_projet),
+            ("🏢 Service", projet.service_demandeur),
+            ("📅 Début", date_debut),
+        )
+        for (caption, value), label in zip(details, self.detail_labels):
+            label.configure(text=f"{caption}\n{value}" if value else "")
+        
+        # Total investissements
+        if total_inv:
+            self.inv_label.configure(text=f"💰 Investissements estimés: {total_inv}")
+        else:
+            self.inv_label.configure(text="")
+
+
 class ProjetsView(ctk.CTkFrame):
     """Projects management view."""
     
@@ -25,6 +207,20 @@ class ProjetsView(ctk.CTkFrame):
         self.db_manager = db_manager
         self.projet_manager = ProjetManager(db_manager)
         
+        # Virtualized list state
+        self._projets: list[Projet] = []
+        self._rendered: dict[int, tuple[ProjetCard, int]] = {}  # index -> (card, window id)
+        self._card_pool: list[ProjetCard] = []  # built cards not placed on the canvas
+        self._previous_cards: dict[int, ProjetCard] = {}  # project id -> card, during a reload
+        self._card_height: Optional[int] = None
+        self._totals_cache: dict[int, float] = {}  # project id -> total investissements
+        self._formatted: dict[int, tuple[str, str]] = {}  # project id -> (date début, total) as shown
+        self._reload_after: Optional[str] = None  # pending filter reload
+        self._loaded_statut: Optional[str] = None  # filter applied by the last load
+        self._overscan_after: Optional[str] = None  # pending placement of the overscan cards
+        self._dialog: Optional["ProjetDialog"] = None  # hidden between uses
+        self._confirm_dialog: Optional[ConfirmDialog] = None  # hidden between uses
+        
         self.create_widgets()
         self.load_projets()
     
@@ -42,7 +238,7 @@ class ProjetsView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame,
             text="📁 Gestion des Projets",
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=_font(28, "bold"),
             text_color=COLOR_PRIMARY
         )
         title_label.grid(row=0, column=0, sticky="w")
@@ -65,7 +261,7 @@ class ProjetsView(ctk.CTkFrame):
         ctk.CTkLabel(
             filter_frame,
             text="🔍 Filtres:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(side="left", padx=(10, 20))
         
         ctk.CTkLabel(filter_frame, text="Statut:").pack(side="left", padx=(0, 5))
@@ -73,224 +269,217 @@ class ProjetsView(ctk.CTkFrame):
             filter_frame,
             values=["Tous"] + STATUTS_PROJET,
             width=150,
-            command=lambda _: self.load_projets()
+            command=lambda _: self._schedule_reload()
         )
         self.statut_filter.set("Tous")
         self.statut_filter.pack(side="left", padx=5)
         
-        # Scrollable frame for projects
-        self.projets_scroll = ctk.CTkScrollableFrame(
-            self,
-            fg_color="transparent",
-            corner_radius=0
-        )
-        self.projets_scroll.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
-        self.projets_scroll.grid_columnconfigure(0, weight=1)
+        # Project list: a canvas on which only the visible cards are placed
+        self.projets_list = CanvasList(self, on_scroll=self._render_visible)
+        self.projets_list.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
+    
+    def _schedule_reload(self):
+        """Reload the list once the filter has stopped changing."""
+        if self._reload_after:
+            self.after_cancel(self._reload_after)
+        self._reload_after = self.after(_RELOAD_DELAY, self._reload)
+    
+    def _reload(self):
+        """Run the reload scheduled by _schedule_reload, unless the filter ends up unchanged."""
+        self._reload_after = None
+        if self._statut() != self._loaded_statut:
+            self.load_projets()
+    
+    def on_show(self):
+        """Reload the projects when the cached view is shown again."""
+        self.load_projets()
     
     def load_projets(self):
         """Load and display projects."""
-        # Clear existing
-        for widget in self.projets_scroll.winfo_children():
-            widget.destroy()
-        
-        # Get filters
-        statut = self.statut_filter.get()
-        statut = None if statut == "Tous" else statut
+        # Clear existing, keeping each card aside for the project it shows
+        self._release_cards()
+        self.projets_list.clear()
         
         # Load projects
-        projets = self.projet_manager.get_all_projets(statut=statut)
-        
-        if not projets:
-            no_data_label = ctk.CTkLabel(
-                self.projets_scroll,
-                text="📂 Aucun projet trouvé\n\nCliquez sur '➕ Nouveau Projet' pour commencer",
-                font=ctk.CTkFont(size=16, weight="bold"),
-                text_color="#0d7377",  # Couleur visible sur fond noir
-                justify="center"
-            )
-            no_data_label.pack(pady=50)
-            return
+        statut = self._statut()
+        self._loaded_statut = statut
+        self._projets = self.projet_manager.get_all_projets(statut=statut)
+        self._totals_cache = self.projet_manager.get_totals_investissements_map(statut=statut)
+        self._formatted = {projet.id: self._format(projet) for projet in self._projets}
         
-        # Display projects
-        for projet in projets:
-            self.create_projet_card(projet)
+        self._layout()
     
-    def create_projet_card(self, projet: Projet):
-        """Create a project card."""
-        card = ctk.CTkFrame(self.projets_scroll, fg_color=COLOR_BG_CARD, corner_radius=10)
-        card.pack(fill="x", pady=5, padx=5)
-        
-        # Main info frame
-        info_frame = ctk.CTkFrame(card, fg_color="transparent")
-        info_frame.pack(fill="x", padx=15, pady=15)
-        info_frame.grid_columnconfigure(1, weight=1)
-        
-        # Project name
-        nom_label = ctk.CTkLabel(
-            info_frame,
-            text=f"📁 {projet.nom_projet}",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="white"
+    def _format(self, projet: Projet) -> tuple[str, str]:
+        """Start date and investment total of a project as shown on its card."""
+        total = self._totals_cache.get(projet.id, 0.0)
+        return (
+            format_date(projet.date_debut) if projet.date_debut else "",
+            format_montant(total) if total > 0 else ""
         )
-        nom_label.grid(row=0, column=0, sticky="w", columnspan=2)
-        
-        # FAP badge
-        if projet.fap_redigee:
-            fap_label = ctk.CTkLabel(
-                info_frame,
-                text="📋 FAP",
-                font=ctk.CTkFont(size=11),
-                text_color=COLOR_SUCCESS
+    
+    def _statut(self) -> Optional[str]:
+        """Status selected in the filter, None for all."""
+        statut = self.statut_filter.get()
+        return None if statut == "Tous" else statut
+    
+    def _release_cards(self):
+        """Take the placed cards off the canvas, keeping each aside for the project it shows."""
+        self._previous_cards = {
+            self._projets[index].id: card for index, (card, _) in self._rendered.items()
+        }
+        for _, window_id in self._rendered.values():
+            self.projets_list.canvas.delete(window_id)
+        self._rendered.clear()
+        self.projets_list.canvas.delete("message")
+    
+    def _layout(self):
+        """Size the list for self._projets and place the visible cards."""
+        if not self._projets:
+            self.projets_list.show_message(
+                "📂 Aucun projet trouvé\n\nCliquez sur '➕ Nouveau Projet' pour commencer",
+                _font(16, "bold"),
+                fill="#0d7377"  # Couleur visible sur fond noir
             )
-            fap_label.grid(row=0, column=2, sticky="e", padx=5)
+            self.projets_list.set_content_height(0)
         else:
-            fap_label = ctk.CTkLabel(
-                info_frame,
-                text="⚠️ Sans FAP",
-                font=ctk.CTkFont(size=11),
-                text_color=COLOR_WARNING
-            )
-            fap_label.grid(row=0, column=2, sticky="e", padx=5)
-        
-        # Status badge
-        statut_colors = {
-            "En cours": COLOR_PRIMARY,
-            "Terminé": COLOR_SUCCESS,
-            "Suspendu": COLOR_DANGER
-        }
-        statut_color = statut_colors.get(projet.statut, "white")
-        
-        statut_label = ctk.CTkLabel(
-            info_frame,
-            text=projet.statut,
-            font=ctk.CTkFont(size=11),
-            text_color=statut_color
-        )
-        statut_label.grid(row=0, column=3, sticky="e", padx=5)
-        
-        # Project details
-        details_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-        details_frame.grid(row=1, column=0, columnspan=4, sticky="ew", pady=(10, 0))
-        details_frame.grid_columnconfigure((0, 1, 2), weight=1)
-        
-        # Porteur
-        if projet.porteur_projet:
-            ctk.CTkLabel(
-                details_frame,
-                text="👤 Porteur",
-                font=ctk.CTkFont(size=11),
-                text_color="gray60"
-            ).grid(row=0, column=0, sticky="w")
-            
-            ctk.CTkLabel(
-                details_frame,
-                text=projet.porteur_projet,
-                font=ctk.CTkFont(size=13),
-                text_color="white"
-            ).grid(row=1, column=0, sticky="w")
-        
-        # Service
-        if projet.service_demandeur:
-            ctk.CTkLabel(
-                details_frame,
-                text="🏢 Service",
-                font=ctk.CTkFont(size=11),
-                text_color="gray60"
-            ).grid(row=0, column=1)
-            
-            ctk.CTkLabel(
-                details_frame,
-                text=projet.service_demandeur,
-                font=ctk.CTkFont(size=13),
-                text_color="white"
-            ).grid(row=1, column=1)
-        
-        # Dates
-        if projet.date_debut:
-            ctk.CTkLabel(
-                details_frame,
-                text="📅 Début",
-                font=ctk.CTkFont(size=11),
-                text_color="gray60"
-            ).grid(row=0, column=2, sticky="e")
+            if self._card_height is None:
+                # Every card has the same layout: measure one
+                card = self._new_card()
+                card.update_idletasks()
+                self._card_height = card.winfo_reqheight() + _CARD_SPACING
+                self._card_pool.append(card)
             
-            ctk.CTkLabel(
-                details_frame,
-                text=format_date(projet.date_debut),
-                font=ctk.CTkFont(size=13),
-                text_color="white"
-            ).grid(row=1, column=2, sticky="e")
+            # Display projects
+            self.projets_list.set_content_height(len(self._projets) * self._card_height)
+            self._render_visible()
         
-        # Total investissements
-        total_inv = self.projet_manager.get_total_investissements(projet.id)
-        if total_inv > 0:
-            inv_label = ctk.CTkLabel(
-                info_frame,
-                text=f"💰 Investissements estimés: {format_montant(total_inv)}",
-                font=ctk.CTkFont(size=12),
-                text_color=COLOR_SUCCESS
-            )
-            inv_label.grid(row=2, column=0, columnspan=4, sticky="w", pady=(10, 0))
+        # Cards of projects that are no longer visible go back to the pool
+        self._card_pool.extend(self._previous_cards.values())
+        self._previous_cards = {}
+    
+    def _update_projet(self, projet: Projet):
+        """Show a created or edited project without reloading the list."""
+        self._release_cards()
+        self._projets = [p for p in self._projets if p.id != projet.id]
+        statut = self._statut()
+        if statut is None or projet.statut == statut:
+            self._formatted[projet.id] = self._format(projet)
+            self._projets.append(projet)
+            # Same order as get_all_projets
+            self._projets.sort(key=lambda p: p.nom_projet)
+        self._layout()
+    
+    def _remove_projet(self, projet_id: int):
+        """Remove a deleted project from the list without reloading it."""
+        self._release_cards()
+        self._projets = [p for p in self._projets if p.id != projet_id]
+        self._totals_cache.pop(projet_id, None)
+        self._formatted.pop(projet_id, None)
+        self._layout()
+    
+    def _render_visible(self):
+        """Place the cards intersecting the viewport and drop the others.
         
-        # Action buttons
-        btn_frame = ctk.CTkFrame(card, fg_color="transparent")
-        btn_frame.pack(fill="x", padx=15, pady=(0, 15))
+        The overscan cards are placed once Tk is idle, so the visible ones are painted first.
+        """
+        count = len(self._projets)
+        if not count or self._card_height is None:
+            return
         
-        details_btn = ctk.CTkButton(
-            btn_frame,
-            text="📋 Détails",
-            command=lambda p=projet: self.show_details_dialog(p),
-            width=100,
-            height=28,
-            fg_color=COLOR_WARNING,
-            hover_color=COLOR_PRIMARY
-        )
-        details_btn.pack(side="right", padx=5)
+        first, last = self._visible_range()
+        low, high = max(first - _OVERSCAN, 0), min(last + _OVERSCAN, count)
         
-        edit_btn = ctk.CTkButton(
-            btn_frame,
-            text="✏️ Modifier",
-            command=lambda p=projet: self.show_edit_dialog(p),
-            width=100,
-            height=28,
-            fg_color=COLOR_PRIMARY,
-            hover_color=COLOR_SUCCESS
-        )
-        edit_btn.pack(side="right", padx=5)
+        for index in [i for i in self._rendered if not low <= i < high]:
+            card, window_id = self._rendered.pop(index)
+            self.projets_list.canvas.delete(window_id)
+            self._card_pool.append(card)
         
-        delete_btn = ctk.CTkButton(
-            btn_frame,
-            text="🗑️ Supprimer",
-            command=lambda p=projet: self.delete_projet(p),
-            width=100,
-            height=28,
-            fg_color=COLOR_DANGER,
-            hover_color="#cc0000"
+        self._place_cards(first, last)
+        if self._overscan_after is None:
+            self._overscan_after = self.after_idle(self._place_overscan)
+    
+    def _place_overscan(self):
+        """Place the cards just above and below the viewport (scheduled by _render_visible)."""
+        self._overscan_after = None
+        count = len(self._projets)
+        if not count or self._card_height is None:
+            return
+        first, last = self._visible_range()
+        self._place_cards(max(first - _OVERSCAN, 0), min(last + _OVERSCAN, count))
+    
+    def _visible_range(self) -> tuple[int, int]:
+        """Indexes of the first and past-the-last projects intersecting the viewport."""
+        count = len(self._projets)
+        top, bottom = self.projets_list.canvas.yview()
+        return int(top * count), min(int(bottom * count) + 1, count)
+    
+    def _place_cards(self, first: int, last: int):
+        """Place a card for each project in [first, last) that has none yet."""
+        for index in range(first, last):
+            if index in self._rendered:
+                continue
+            card = self._acquire_card(self._projets[index])
+            window_id = self.projets_list.place_row(
+                index * self._card_height + _CARD_SPACING // 2,
+                card,
+                self._card_height - _CARD_SPACING
+            )
+            self._rendered[index] = (card, window_id)
+    
+    def _acquire_card(self, projet: Projet) -> ProjetCard:
+        """Take the card that already showed this project, else one from the pool (or a new one)."""
+        card = self._previous_cards.pop(projet.id, None)
+        if card is None:
+            card = self._card_pool.pop() if self._card_pool else self._new_card()
+        card.render(projet, *self._formatted[projet.id])
+        return card
+    
+    def _new_card(self) -> ProjetCard:
+        """Build an empty card whose buttons act on the project it shows."""
+        return ProjetCard(
+            self.projets_list.canvas,
+            on_details=self.show_details_dialog,
+            on_edit=self.show_edit_dialog,
+            on_delete=self.delete_projet
         )
-        delete_btn.pack(side="right", padx=5)
+    
+    def _open_dialog(self, projet: Optional[Projet], title: str) -> "ProjetDialog":
+        """Show the project dialog, built once and then reused, and wait until it closes."""
+        if self._dialog is None or not self._dialog.winfo_exists():
+            self._dialog = ProjetDialog(
+                self, self.db_manager, self.projet_manager, projet=projet, title=title
+            )
+        else:
+            self._dialog.show(projet, title)
+        self._dialog.wait_variable(self._dialog.closed)
+        return self._dialog
     
     def show_create_dialog(self):
         """Show dialog to create a new project."""
-        dialog = ProjetDialog(self, self.db_manager, title="Créer un Projet")
-        dialog.wait_window()
+        dialog = self._open_dialog(None, "Créer un Projet")
         if dialog.result:
-            self.load_projets()
+            self._update_projet(dialog.projet)
     
     def show_edit_dialog(self, projet: Projet):
         """Show dialog to edit a project."""
-        dialog = ProjetDialog(self, self.db_manager, projet=projet, title="Modifier le Projet")
-        dialog.wait_window()
+        dialog = self._open_dialog(projet, "Modifier le Projet")
         if dialog.result:
-            self.load_projets()
+            self._update_projet(dialog.projet)
     
     def show_details_dialog(self, projet: Projet):
         """Show detailed project information dialog."""
         dialog = ProjetDetailsDialog(self, self.db_manager, projet)
         dialog.wait_window()
     
+    def _confirm(self, title: str, message: str) -> bool:
+        """Ask a yes/no question in the confirmation dialog, built once and then reused."""
+        if self._confirm_dialog is None or not self._confirm_dialog.winfo_exists():
+            self._confirm_dialog = ConfirmDialog(self)
+        return self._confirm_dialog.ask(title, message)
+    
     def delete_projet(self, projet: Projet):
         """Delete a project."""
-        if messagebox.askyesno(
+        if self._confirm(
             "Confirmation",
             f"Voulez-vous vraiment supprimer ce projet?\n\n"
             f"Nom: {projet.nom_projet}\n\n"
@@ -299,7 +488,7 @@ class ProjetsView(ctk.CTkFrame):
             success, msg = self.projet_manager.delete_projet(projet.id)
             if success:
                 messagebox.showinfo("Succès", msg)
-                self.load_projets()
+                self._remove_projet(projet.id)
             else:
                 messagebox.showerror("Erreur", msg)
 
@@ -307,22 +496,69 @@ class ProjetsView(ctk.CTkFrame):
 class ProjetDialog(ctk.CTkToplevel):
     """Dialog for creating/editing projects."""
     
-    def __init__(self, parent, db_manager: DatabaseManager, projet: Optional[Projet] = None, title: str = "Projet"):
+    def __init__(self, parent, db_manager: DatabaseManager, projet_manager: ProjetManager,
+                 projet: Optional[Projet] = None, title: str = "Projet"):
         super().__init__(parent)
         self.db_manager = db_manager
-        self.projet_manager = ProjetManager(db_manager)
+        # The view's manager, so that saving clears the project lists it caches
+        self.projet_manager = projet_manager
         self.projet = projet
         self.result = None
+        self._total_after: Optional[str] = None  # pending total computation
+        self._parsed_amounts: dict[ctk.CTkEntry, tuple[str, float]] = {}  # entry -> (text, value)
+        # Set when the dialog is closed; the dialog is hidden, not destroyed
+        self.closed = tk.BooleanVar(value=False)
         
         self.title(title)
         self.geometry("600x900")
         self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        # Hidden while the form is built, so it is laid out once instead of after every pack
+        self.withdraw()
+        
+        self.create_widgets()
+        
+        if projet:
+            self.populate_data()
         
         # Make dialog modal
         self.transient(parent)
+        self.update_idletasks()
+        self.deiconify()
         self.grab_set()
-        
-        self.create_widgets()
+    
+    def show(self, projet: Optional[Projet], title: str):
+        """Reopen the hidden dialog for another project."""
+        self._reset(projet)
+        self.title(title)
+        self.closed.set(False)
+        self.deiconify()
+        self.grab_set()
+    
+    def close(self):
+        """Hide the dialog so that it can be reused."""
+        self.grab_release()
+        self.withdraw()
+        self.closed.set(True)
+    
+    def _reset(self, projet: Optional[Projet]):
+        """Clear the form, then fill it with projet if given."""
+        self.projet = projet
+        self.result = None
+        if self._total_after:
+            self.after_cancel(self._total_after)
+            self._total_after = None
+        
+        for entry in (self.nom_entry, self.porteur_entry, self.service_entry, self.date_debut_entry,
+                      self.date_fin_entry, self.date_service_entry, self.licence_entry, self.materiel_entry,
+                      self.logiciel_entry, self.formation_entry, self.maintenance_entry):
+            entry.delete(0, "end")
+        for textbox in (self.tech_text, self.contacts_text, self.sourcing_text, self.remarques_text):
+            textbox.delete("1.0", "end")
+        self.fap_var.set(False)
+        self.statut_combo.set("En cours")
+        self.total_label.configure(text="0.00 €")
+        self.main_frame._parent_canvas.yview_moveto(0)
         
         if projet:
             self.populate_data()
@@ -332,6 +568,7 @@ class ProjetDialog(ctk.CTkToplevel):
         # Main scrollable frame
         main_frame = ctk.CTkScrollableFrame(self, fg_color="transparent")
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        self.main_frame = main_frame
         
         # Nom du projet
         ctk.CTkLabel(main_frame, text="Nom du Projet *", anchor="w").pack(fill="x", pady=(0, 5))
@@ -386,7 +623,7 @@ class ProjetDialog(ctk.CTkToplevel):
         invest_label = ctk.CTkLabel(
             main_frame, 
             text="📊 INVESTISSEMENTS", 
-            font=ctk.CTkFont(size=14, weight="bold"), 
+            font=_font(14, "bold"), 
             text_color=COLOR_PRIMARY
         )
         invest_label.pack(fill="x", pady=(10, 10))
@@ -419,20 +656,23 @@ class ProjetDialog(ctk.CTkToplevel):
         # Total automatique (lecture seule)
         total_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         total_frame.pack(fill="x", pady=(5, 15))
-        ctk.CTkLabel(total_frame, text="TOTAL ESTIMÉ:", font=ctk.CTkFont(size=12, weight="bold"), anchor="w").pack(side="left")
+        ctk.CTkLabel(total_frame, text="TOTAL ESTIMÉ:", font=_font(12, "bold"), anchor="w").pack(side="left")
         self.total_label = ctk.CTkLabel(
             total_frame, 
             text="0.00 €", 
-            font=ctk.CTkFont(size=14, weight="bold"), 
+            font=_font(14, "bold"), 
             text_color="#4ecdc4",
             anchor="w"
         )
         self.total_label.pack(side="left", padx=(10, 0))
         
         # Bind calculation
-        for entry in [self.licence_entry, self.materiel_entry, self.logiciel_entry, 
-                     self.formation_entry, self.maintenance_entry]:
-            entry.bind('<KeyRelease>', lambda e: self.calculate_total())
+        self._money_entries = (
+            self.licence_entry, self.materiel_entry, self.logiciel_entry,
+            self.formation_entry, self.maintenance_entry
+        )
+        for entry in self._money_entries:
+            entry.bind('<KeyRelease>', self._schedule_total)
         
         # Contacts pris
         ctk.CTkLabel(main_frame, text="Contacts Pris", anchor="w").pack(fill="x", pady=(0, 5))
@@ -459,7 +699,7 @@ class ProjetDialog(ctk.CTkToplevel):
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="Annuler",
-            command=self.destroy,
+            command=self.close,
             width=100,
             fg_color="gray40",
             hover_color="gray50"
@@ -476,20 +716,31 @@ class ProjetDialog(ctk.CTkToplevel):
         )
         save_btn.pack(side="right", padx=5)
     
+    def _schedule_total(self, event=None):
+        """Recompute the total once typing in the amounts has paused."""
+        if self._total_after:
+            self.after_cancel(self._total_after)
+        self._total_after = self.after(_TOTAL_DELAY, self.calculate_total)
+    
     def calculate_total(self):
         """Calculate and display total investment."""
+        self._total_after = None
         try:
-            licence = float(self.licence_entry.get() or 0)
-            materiel = float(self.materiel_entry.get() or 0)
-            logiciel = float(self.logiciel_entry.get() or 0)
-            formation = float(self.formation_entry.get() or 0)
-            maintenance = float(self.maintenance_entry.get() or 0)
-            
-            total = licence + materiel + logiciel + formation + maintenance
+            total = sum(self._amount(entry) for entry in self._money_entries)
             self.total_label.configure(text=f"{total:.2f} €")
         except ValueError:
             self.total_label.configure(text="0.00 €")
     
+    def _amount(self, entry: ctk.CTkEntry) -> float:
+        """Value of an amount entry, parsed again only when its text changed (ValueError if invalid)."""
+        text = entry.get()
+        cached = self._parsed_amounts.get(entry)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        value = parse_montant(text)
+        self._parsed_amounts[entry] = (text, value)
+        return value
+    
     def populate_data(self):
         """Populate form with project data."""
         if self.projet:
@@ -572,41 +823,45 @@ class ProjetDialog(ctk.CTkToplevel):
             
             # Parse financial values
             try:
-                investissement_licence = float(self.licence_entry.get() or 0)
-                investissement_materiel = float(self.materiel_entry.get() or 0)
-                investissement_logiciel = float(self.logiciel_entry.get() or 0)
-                cout_formation = float(self.formation_entry.get() or 0)
-                frais_maintenance = float(self.maintenance_entry.get() or 0)
+                investissement_licence = self._amount(self.licence_entry)
+                investissement_materiel = self._amount(self.materiel_entry)
+                investissement_logiciel = self._amount(self.logiciel_entry)
+                cout_formation = self._amount(self.formation_entry)
+                frais_maintenance = self._amount(self.maintenance_entry)
             except ValueError:
                 messagebox.showerror("Erreur", "Les montants financiers doivent être des nombres valides")
                 return
             
             # Create or update
             if self.projet:
-                # Update
-                self.projet.nom_projet = nom
-                self.projet.fap_redigee = fap_redigee
-                self.projet.statut = statut
-                self.projet.porteur_projet = porteur
-                self.projet.service_demandeur = service
-                self.projet.date_debut = date_debut
-                self.projet.date_fin_estimee = date_fin
-                self.projet.date_mise_service = date_service
-                self.projet.contacts_pris = contacts_pris
-                self.projet.sourcing = sourcing
-                self.projet.remarques_1 = remarques
-                self.projet.technologies_utilisees = technologies
-                self.projet.investissement_licence = investissement_licence
-                self.projet.investissement_materiel = investissement_materiel
-                self.projet.investissement_logiciel = investissement_logiciel
-                self.projet.cout_formation = cout_formation
-                self.projet.frais_maintenance = frais_maintenance
+                # Update a copy: the listed (and cached) project keeps its values if the update fails
+                updated = dataclasses.replace(
+                    self.projet,
+                    nom_projet=nom,
+                    fap_redigee=fap_redigee,
+                    statut=statut,
+                    porteur_projet=porteur,
+                    service_demandeur=service,
+                    date_debut=date_debut,
+                    date_fin_estimee=date_fin,
+                    date_mise_service=date_service,
+                    contacts_pris=contacts_pris,
+                    sourcing=sourcing,
+                    remarques_1=remarques,
+                    technologies_utilisees=technologies,
+                    investissement_licence=investissement_licence,
+                    investissement_materiel=investissement_materiel,
+                    investissement_logiciel=investissement_logiciel,
+                    cout_formation=cout_formation,
+                    frais_maintenance=frais_maintenance
+                )
                 
-                success, msg = self.projet_manager.update_projet(self.projet)
+                success, msg = self.projet_manager.update_projet(updated)
                 if success:
                     messagebox.showinfo("Succès", msg)
+                    self.projet = updated
                     self.result = True
-                    self.destroy()
+                    self.close()
                 else:
                     messagebox.showerror("Erreur", msg)
             else:
@@ -634,8 +889,10 @@ class ProjetDialog(ctk.CTkToplevel):
                 success, msg, projet_id = self.projet_manager.create_projet(new_projet)
                 if success:
                     messagebox.showinfo("Succès", msg)
+                    new_projet.id = projet_id
+                    self.projet = new_projet
                     self.result = True
-                    self.destroy()
+                    self.close()
                 else:
                     messagebox.showerror("Erreur", msg)
                     
@@ -651,6 +908,8 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
         self.db_manager = db_manager
         self.projet_manager = ProjetManager(db_manager)
         self.projet = projet
+        # Tabs whose data has been loaded; the others are loaded when first selected
+        self._loaded_tabs: set[str] = set()
         
         self.title(f"Détails - {projet.nom_projet}")
         self.geometry("800x700")
@@ -660,12 +919,11 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
         self.grab_set()
         
         self.create_widgets()
-        self.load_data()
     
     def create_widgets(self):
         """Create dialog widgets."""
         # Main container with tabs
-        self.tabview = ctk.CTkTabview(self)
+        self.tabview = ctk.CTkTabview(self, command=self.load_data)
         self.tabview.pack(fill="both", expand=True, padx=20, pady=20)
         
         # Create tabs
@@ -691,7 +949,7 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
             btn_frame,
             text="👥 Gérer les Prospects / Fournisseurs",
             command=self.open_prospects_window,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             fg_color=COLOR_PRIMARY,
             hover_color="#0a5a5d",
             height=40
@@ -703,7 +961,7 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
             btn_frame,
             text="📊 Export Excel (Comparatif)",
             command=self.export_to_excel,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             fg_color="#4ecdc4",
             hover_color="#3db5ad",
             height=40
@@ -730,7 +988,7 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             scroll,
             text=self.projet.nom_projet,
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=_font(20, "bold"),
             text_color=COLOR_PRIMARY
         ).pack(anchor="w", pady=(0, 20))
         
@@ -746,28 +1004,13 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
             ("Technologies utilisées", self.projet.technologies_utilisees or "-"),
         ]
         
-        for label, value in info_fields:
-            field_frame = ctk.CTkFrame(scroll, fg_color=COLOR_BG_CARD, corner_radius=8)
-            field_frame.pack(fill="x", pady=5)
-            field_frame.grid_columnconfigure(1, weight=1)
-            
-            ctk.CTkLabel(
-                field_frame,
-                text=label + ":",
-                font=ctk.CTkFont(weight="bold")
-            ).grid(row=0, column=0, sticky="w", padx=10, pady=8)
-            
-            ctk.CTkLabel(
-                field_frame,
-                text=value,
-                anchor="e"
-            ).grid(row=0, column=1, sticky="e", padx=10, pady=8)
+        self.create_fields_box(scroll, info_fields)
         
         # Financial section
         ctk.CTkLabel(
             scroll,
             text="💰 Investissements Projet",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_font(16, "bold"),
             text_color=COLOR_PRIMARY
         ).pack(anchor="w", pady=(20, 10))
         
@@ -787,22 +1030,7 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
             self.projet.frais_maintenance
         )
         
-        for label, value in financial_fields:
-            field_frame = ctk.CTkFrame(scroll, fg_color=COLOR_BG_CARD, corner_radius=8)
-            field_frame.pack(fill="x", pady=5)
-            field_frame.grid_columnconfigure(1, weight=1)
-            
-            ctk.CTkLabel(
-                field_frame,
-                text=label + ":",
-                font=ctk.CTkFont(weight="bold")
-            ).grid(row=0, column=0, sticky="w", padx=10, pady=8)
-            
-            ctk.CTkLabel(
-                field_frame,
-                text=value,
-                anchor="e"
-            ).grid(row=0, column=1, sticky="e", padx=10, pady=8)
+        self.create_fields_box(scroll, financial_fields)
         
         # Total
         total_frame = ctk.CTkFrame(scroll, fg_color="#4ecdc4", corner_radius=8)
@@ -812,14 +1040,14 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             total_frame,
             text="TOTAL ESTIMÉ:",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color="white"
         ).grid(row=0, column=0, sticky="w", padx=10, pady=12)
         
         ctk.CTkLabel(
             total_frame,
             text=format_montant(total_investissement),
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_font(16, "bold"),
             text_color="white",
             anchor="e"
         ).grid(row=0, column=1, sticky="e", padx=10, pady=12)
@@ -834,12 +1062,34 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
         if self.projet.remarques_1:
             self.create_text_section(scroll, "Remarques", self.projet.remarques_1)
     
+    def create_fields_box(self, parent, fields: list[tuple[str, str]]):
+        """Show label/value pairs in a single read-only textbox, one field per line."""
+        lines = sum(value.count("\n") + 1 for _, value in fields)
+        box = ctk.CTkTextbox(
+            parent,
+            font=_font(13),
+            wrap="word",
+            fg_color=COLOR_BG_CARD,
+            corner_radius=8,
+            height=lines * _font(13).metrics("linespace") + 20
+        )
+        box.pack(fill="x", pady=5)
+        box.tag_config("label", foreground="gray60")
+        box.tag_config("value", foreground="white")
+        
+        for index, (label, value) in enumerate(fields):
+            if index:
+                box.insert("end", "\n")
+            box.insert("end", f"{label}: ", "label")
+            box.insert("end", value, "value")
+        box.configure(state="disabled")
+    
     def create_text_section(self, parent, title, content):
         """Create a text section."""
         ctk.CTkLabel(
             parent,
             text=title,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=_font(13, "bold"),
             text_color=COLOR_PRIMARY
         ).pack(anchor="w", pady=(15, 5))
         
@@ -860,7 +1110,7 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             header,
             text="Liste des Investissements",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).pack(side="left")
         
         # Scrollable list
@@ -876,7 +1126,7 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             header,
             text="Contacts Sourcing",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).pack(side="left")
         
         # Scrollable list
@@ -884,133 +1134,142 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
         self.contacts_scroll.pack(fill="both", expand=True, padx=10, pady=10)
     
     def load_data(self):
-        """Load investissements and contacts data."""
-        self.load_investissements()
-        self.load_contacts()
+        """Load the selected tab's data the first time it is shown."""
+        tab = self.tabview.get()
+        if tab in self._loaded_tabs:
+            return
+        self._loaded_tabs.add(tab)
+        
+        if tab == "💰 Investissements":
+            self.load_investissements()
+        elif tab == "👥 Contacts Sourcing":
+            self.load_contacts()
+    
+    def _load_async(self, fetch: Callable[[], Any], render: Callable[[Any], None]):
+        """Run fetch off the UI thread, then pass its result to render on the UI thread."""
+        threading.Thread(target=self._fetch_then_render, args=(fetch, render), daemon=True).start()
+    
+    def _fetch_then_render(self, fetch: Callable[[], Any], render: Callable[[Any], None]):
+        """Worker thread body of _load_async."""
+        try:
+            result = fetch()
+        except Exception as e:
+            print(f"Erreur lors du chargement des détails du projet: {e}")
+            return
+        try:
+            self.after(0, render, result)
+        except (RuntimeError, TclError):
+            # The dialog was closed while the query was running
+            pass
     
     def load_investissements(self):
-        """Load and display investissements."""
-        # Clear existing
-        for widget in self.invest_scroll.winfo_children():
-            widget.destroy()
-        
-        investissements = self.projet_manager.get_investissements(self.projet.id)
-        
-        if not investissements:
-            ctk.CTkLabel(
-                self.invest_scroll,
-                text="Aucun investissement enregistré",
-                text_color="gray60"
-            ).pack(pady=20)
+        """Load investissements in the background, then display them."""
+        self._load_async(
+            functools.partial(self.projet_manager.get_investissements_with_total, self.projet.id),
+            self._render_investissements
+        )
+    
+    def _render_investissements(self, data: tuple[list[InvestissementProjet], float]):
+        """Display investissements and their total (UI thread)."""
+        if not self.winfo_exists():
             return
+        investissements, total = data
         
-        # Display investissements
-        total = 0
-        for inv in investissements:
-            card = ctk.CTkFrame(self.invest_scroll, fg_color=COLOR_BG_CARD, corner_radius=8)
-            card.pack(fill="x", pady=5)
-            
-            info_frame = ctk.CTkFrame(card, fg_color="transparent")
-            info_frame.pack(fill="x", padx=15, pady=10)
-            info_frame.grid_columnconfigure(1, weight=1)
-            
-            ctk.CTkLabel(
-                info_frame,
-                text=inv.type,
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color=COLOR_PRIMARY
-            ).grid(row=0, column=0, sticky="w")
-            
-            ctk.CTkLabel(
-                info_frame,
-                text=format_montant(inv.montant_estime),
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color=COLOR_SUCCESS
-            ).grid(row=0, column=1, sticky="e")
+        # Refill the list while it is hidden, so it is laid out once
+        with _refilling(self.invest_scroll):
+            if not investissements:
+                ctk.CTkLabel(
+                    self.invest_scroll,
+                    text="Aucun investissement enregistré",
+                    text_color="gray60"
+                ).pack(pady=20)
+                return
             
-            if inv.description:
+            # Display investissements
+            for inv in investissements:
+                card = ctk.CTkFrame(self.invest_scroll, fg_color=COLOR_BG_CARD, corner_radius=8)
+                card.pack(fill="x", pady=5)
+                
+                info_frame = ctk.CTkFrame(card, fg_color="transparent")
+                info_frame.pack(fill="x", padx=15, pady=10)
+                info_frame.grid_columnconfigure(1, weight=1)
+                
                 ctk.CTkLabel(
                     info_frame,
-                    text=inv.description,
-                    font=ctk.CTkFont(size=11),
-                    text_color="gray70"
-                ).grid(row=1, column=0, columnspan=2, sticky="w", pady=(5, 0))
+                    text=inv.type,
+                    font=_font(13, "bold"),
+                    text_color=COLOR_PRIMARY
+                ).grid(row=0, column=0, sticky="w")
+                
+                ctk.CTkLabel(
+                    info_frame,
+                    text=format_montant(inv.montant_estime),
+                    font=_font(13, "bold"),
+                    text_color=COLOR_SUCCESS
+                ).grid(row=0, column=1, sticky="e")
+                
+                if inv.description:
+                    _caption(info_frame, inv.description, fg="gray70").grid(row=1, column=0, columnspan=2, sticky="w", pady=(5, 0))
             
-            total += inv.montant_estime
-        
-        # Total
-        total_frame = ctk.CTkFrame(self.invest_scroll, fg_color=COLOR_PRIMARY, corner_radius=8)
-        total_frame.pack(fill="x", pady=(10, 0))
-        
-        ctk.CTkLabel(
-            total_frame,
-            text=f"Total Estimé: {format_montant(total)}",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color="white"
-        ).pack(padx=15, pady=10)
+            # Total
+            total_frame = ctk.CTkFrame(self.invest_scroll, fg_color=COLOR_PRIMARY, corner_radius=8)
+            total_frame.pack(fill="x", pady=(10, 0))
+            
+            ctk.CTkLabel(
+                total_frame,
+                text=f"Total Estimé: {format_montant(total)}",
+                font=_font(14, "bold"),
+                text_color="white"
+            ).pack(padx=15, pady=10)
     
     def load_contacts(self):
-        """Load and display contacts sourcing."""
-        # Clear existing
-        for widget in self.contacts_scroll.winfo_children():
-            widget.destroy()
-        
-        contacts = self.projet_manager.get_contacts_sourcing(self.projet.id)
-        
-        if not contacts:
-            ctk.CTkLabel(
-                self.contacts_scroll,
-                text="Aucun contact sourcing enregistré",
-                text_color="gray60"
-            ).pack(pady=20)
+        """Load contacts sourcing in the background, then display them."""
+        self._load_async(
+            functools.partial(self.projet_manager.get_contacts_sourcing, self.projet.id),
+            self._render_contacts
+        )
+    
+    def _render_contacts(self, contacts: list[ContactSourcing]):
+        """Display contacts sourcing (UI thread)."""
+        if not self.winfo_exists():
             return
         
-        # Display contacts
-        for contact in contacts:
-            card = ctk.CTkFrame(self.contacts_scroll, fg_color=COLOR_BG_CARD, corner_radius=8)
-            card.pack(fill="x", pady=5)
-            
-            info_frame = ctk.CTkFrame(card, fg_color="transparent")
-            info_frame.pack(fill="x", padx=15, pady=10)
-            
-            ctk.CTkLabel(
-                info_frame,
-                text=f"👤 {contact.prenom} {contact.nom}",
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color="white"
-            ).pack(anchor="w")
-            
-            if contact.entreprise:
+        # Refill the list while it is hidden, so it is laid out once
+        with _refilling(self.contacts_scroll):
+            if not contacts:
                 ctk.CTkLabel(
-                    info_frame,
-                    text=f"🏢 {contact.entreprise}",
-                    font=ctk.CTkFont(size=11),
-                    text_color="gray70"
-                ).pack(anchor="w", pady=(2, 0))
-            
-            if contact.telephone:
-                ctk.CTkLabel(
-                    info_frame,
-                    text=f"📞 {contact.telephone}",
-                    font=ctk.CTkFont(size=11),
-                    text_color="gray70"
-                ).pack(anchor="w", pady=(2, 0))
-            
-            if contact.email:
-                ctk.CTkLabel(
-                    info_frame,
-                    text=f"✉️ {contact.email}",
-                    font=ctk.CTkFont(size=11),
-                    text_color="gray70"
-                ).pack(anchor="w", pady=(2, 0))
+                    self.contacts_scroll,
+                    text="Aucun contact sourcing enregistré",
+                    text_color="gray60"
+                ).pack(pady=20)
+                return
             
-            if contact.notes:
+            # Display contacts
+            for contact in contacts:
+                card = ctk.CTkFrame(self.contacts_scroll, fg_color=COLOR_BG_CARD, corner_radius=8)
+                card.pack(fill="x", pady=5)
+                
+                info_frame = ctk.CTkFrame(card, fg_color="transparent")
+                info_frame.pack(fill="x", padx=15, pady=10)
+                
                 ctk.CTkLabel(
                     info_frame,
-                    text=f"📝 {contact.notes}",
-                    font=ctk.CTkFont(size=11),
-                    text_color="gray60"
-                ).pack(anchor="w", pady=(5, 0))
+                    text=f"👤 {contact.prenom} {contact.nom}",
+                    font=_font(13, "bold"),
+                    text_color="white"
+                ).pack(anchor="w")
+                
+                if contact.entreprise:
+                    _caption(info_frame, f"🏢 {contact.entreprise}", fg="gray70").pack(anchor="w", pady=(2, 0))
+                
+                if contact.telephone:
+                    _caption(info_frame, f"📞 {contact.telephone}", fg="gray70").pack(anchor="w", pady=(2, 0))
+                
+                if contact.email:
+                    _caption(info_frame, f"✉️ {contact.email}", fg="gray70").pack(anchor="w", pady=(2, 0))
+                
+                if contact.notes:
+                    _caption(info_frame, f"📝 {contact.notes}").pack(anchor="w", pady=(5, 0))
     
     def open_prospects_window(self):
         """Open prospects management window."""
@@ -1029,7 +1288,7 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
         title = ctk.CTkLabel(
             window, 
             text="👥 Prospects / Fournisseurs", 
-            font=ctk.CTkFont(size=24, weight="bold"), 
+            font=_font(24, "bold"), 
             text_color=COLOR_PRIMARY
         )
         title.pack(pady=20)
@@ -1038,8 +1297,8 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
         add_btn = ctk.CTkButton(
             window,
             text="➕ Ajouter un Prospect",
-            command=lambda: self.add_prospect_dialog(window),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            command=functools.partial(self.add_prospect_dialog, window),
+            font=_font(14, "bold"),
             fg_color=COLOR_PRIMARY,
             height=40
         )
@@ -1048,6 +1307,8 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
         # Frame pour la liste des prospects
         self.prospects_frame = ctk.CTkScrollableFrame(window, fg_color="transparent")
         self.prospects_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        # Widgets packed directly in prospects_frame, destroyed on refresh
+        self._prospect_widgets: list = []
         
         # Charger les prospects
         self.refresh_prospects_list(window)
@@ -1055,8 +1316,9 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
     def refresh_prospects_list(self, window):
         """Refresh the prospects list."""
         # Clear existing
-        for widget in self.prospects_frame.winfo_children():
+        for widget in self._prospect_widgets:
             widget.destroy()
+        self._prospect_widgets.clear()
         
         # Get prospects
         prospects = self.projet_manager.get_prospects_by_projet(self.projet.id)
@@ -1066,14 +1328,16 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
             empty_label = ctk.CTkLabel(
                 self.prospects_frame, 
                 text="Aucun prospect ajouté", 
-                font=ctk.CTkFont(size=14), 
+                font=_font(14), 
                 text_color="gray60"
             )
             empty_label.pack(pady=50)
+            self._prospect_widgets.append(empty_label)
         else:
             # Create header
             header_frame = ctk.CTkFrame(self.prospects_frame, fg_color=COLOR_PRIMARY, height=40)
             header_frame.pack(fill="x", pady=(0, 10))
+            self._prospect_widgets.append(header_frame)
             header_frame.grid_columnconfigure((0, 1, 2, 3, 4, 5, 6, 7), weight=1)
             
             headers = ['Prospect', 'Licence', 'Matériel', 'Logiciel', 'Formation', 'Maintenance', 'TOTAL', 'Actions']
@@ -1081,7 +1345,7 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
                 label = ctk.CTkLabel(
                     header_frame, 
                     text=header, 
-                    font=ctk.CTkFont(size=12, weight="bold"),
+                    font=_font(12, "bold"),
                     text_color="white"
                 )
                 label.grid(row=0, column=col, padx=5, pady=10)
@@ -1090,6 +1354,7 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
             for prospect in prospects:
                 row_frame = ctk.CTkFrame(self.prospects_frame, fg_color=COLOR_BG_CARD)
                 row_frame.pack(fill="x", pady=2)
+                self._prospect_widgets.append(row_frame)
                 row_frame.grid_columnconfigure((0, 1, 2, 3, 4, 5, 6, 7), weight=1)
                 
                 # Prospect name
@@ -1106,7 +1371,7 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
                 total_label = ctk.CTkLabel(
                     row_frame, 
                     text=format_montant(prospect['total_estime']), 
-                    font=ctk.CTkFont(size=12, weight="bold"), 
+                    font=_font(12, "bold"), 
                     text_color="#4ecdc4"
                 )
                 total_label.grid(row=0, column=6, padx=5, pady=10)
@@ -1119,7 +1384,7 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
                     actions_frame, 
                     text="✏️", 
                     width=40,
-                    command=lambda p=prospect: self.edit_prospect_dialog(p, window)
+                    command=functools.partial(self.edit_prospect_dialog, prospect, window)
                 )
                 edit_btn.pack(side="left", padx=2)
                 
@@ -1128,7 +1393,7 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
                     text="🗑️", 
                     width=40, 
                     fg_color=COLOR_DANGER,
-                    command=lambda p=prospect: self.delete_prospect_confirm(p['id'], window)
+                    command=functools.partial(self.delete_prospect_confirm, prospect['id'], window)
                 )
                 del_btn.pack(side="left", padx=2)
     
@@ -1196,11 +1461,11 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
                 return
             
             try:
-                licence = float(licence_entry.get() or 0)
-                materiel = float(materiel_entry.get() or 0)
-                logiciel = float(logiciel_entry.get() or 0)
-                formation = float(formation_entry.get() or 0)
-                maintenance = float(maintenance_entry.get() or 0)
+                licence = parse_montant(licence_entry.get())
+                materiel = parse_montant(materiel_entry.get())
+                logiciel = parse_montant(logiciel_entry.get())
+                formation = parse_montant(formation_entry.get())
+                maintenance = parse_montant(maintenance_entry.get())
             except ValueError:
                 messagebox.showerror("Erreur", "Les montants doivent être des nombres valides")
                 return
@@ -1311,11 +1576,11 @@ class ProjetDetailsDialog(ctk.CTkToplevel):
                 return
             
             try:
-                licence = float(licence_entry.get() or 0)
-                materiel = float(materiel_entry.get() or 0)
-                logiciel = float(logiciel_entry.get() or 0)
-                formation = float(formation_entry.get() or 0)
-                maintenance = float(maintenance_entry.get() or 0)
+                licence = parse_montant(licence_entry.get())
+                materiel = parse_montant(materiel_entry.get())
+                logiciel = parse_montant(logiciel_entry.get())
+                formation = parse_montant(formation_entry.get())
+                maintenance = parse_montant(maintenance_entry.get())
             except ValueError:
                 messagebox.showerror("Erreur", "Les montants doivent être des nombres valides")
                 return
@@ -98,6 +98,10 @@ class SauvegardeView(ctk.CTkFrame):
         self.backups_scroll.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
         self.backups_scroll.grid_columnconfigure(0, weight=1)
     
+    def on_show(self):
+        """Reload the backups when the cached view is shown again."""
+        self.load_backups()
+    
     def load_backups(self):
         """Load and display available backups."""
         # Clear existing
@@ -131,6 +131,10 @@ class TodoView(ctk.CTkFrame):
         self.completed_scroll.grid(row=1, column=1, sticky="nsew", padx=(10, 0))
         self.completed_scroll.grid_columnconfigure(0, weight=1)
     
+    def on_show(self):
+        """Reload the tasks when the cached view is shown again."""
+        self.load_todos()
+    
     def load_todos(self):
         """Load and display todos."""
         # Clear existing
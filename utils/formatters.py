@@ -1,10 +1,15 @@
 """
 Formatters for the Budget Management Application.
 """
+import re
 from datetime import date, datetime
 from typing import Optional
 
 
+# Amount typed by the user: digits with an optional decimal point or comma
+_MONTANT_RE = re.compile(r'^\d+(?:[.,]\d+)?$')
+
+
 def format_date(date_obj: Optional[date]) -> str:
     """Format date object to string."""
     if date_obj is None:
@@ -79,6 +84,16 @@ def parse_date(date_str: str) -> Optional[date]:
         return None
 
 
+def parse_montant(montant_str: str) -> float:
+    """Parse an amount typed by the user (empty is 0, decimal comma accepted); ValueError if invalid."""
+    montant_str = montant_str.strip()
+    if not montant_str:
+        return 0.0
+    if not _MONTANT_RE.match(montant_str):
+        raise ValueError(f"Montant invalide: {montant_str}")
+    return float(montant_str.replace(',', '.'))
+
+
 def parse_datetime(datetime_str: str) -> Optional[datetime]:
     """Parse datetime string to datetime object."""
     if not datetime_str:
@@ -6,12 +6,19 @@ from datetime import date, datetime
 from typing import Optional
 
 
+# Patterns compiled once at import time
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_TELEPHONE_RE = re.compile(r'^[\d\s\+\-\(\)\.]+$')
+_NON_DIGIT_RE = re.compile(r'\D')
+_CODE_POSTAL_RE = re.compile(r'^\d{5}$')
+_NUMERO_BC_RE = re.compile(r'^BC-\d{4}-\d{4}$')
+
+
 def validate_email(email: str) -> bool:
     """Validate email format."""
     if not email:
         return True  # Email is optional
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_telephone(telephone: str) -> bool:
@@ -19,8 +26,7 @@ def validate_telephone(telephone: str) -> bool:
     if not telephone:
         return True  # Telephone is optional
     # Accept various formats: +33, 0x xx xx xx xx, etc.
-    pattern = r'^[\d\s\+\-\(\)\.]+$'
-    return bool(re.match(pattern, telephone)) and len(re.sub(r'\D', '', telephone)) >= 10
+    return bool(_TELEPHONE_RE.match(telephone)) and len(_NON_DIGIT_RE.sub('', telephone)) >= 10
 
 
 def validate_montant(montant: float) -> bool:
@@ -63,7 +69,7 @@ def validate_code_postal(code_postal: str) -> bool:
     """Validate French postal code."""
     if not code_postal:
         return True  # Code postal is optional
-    return bool(re.match(r'^\d{5}$', code_postal))
+    return bool(_CODE_POSTAL_RE.match(code_postal))
 
 
 def validate_required_field(value: str, field_name: str) -> tuple[bool, str]:
@@ -82,8 +88,7 @@ def validate_unique_field(value: str, existing_values: list, field_name: str) ->
 
 def validate_numero_bc(numero_bc: str) -> bool:
     """Validate bon de commande number format (BC-YYYY-NNNN)."""
-    pattern = r'^BC-\d{4}-\d{4}$'
-    return bool(re.match(pattern, numero_bc))
+    return bool(_NUMERO_BC_RE.match(numero_bc))
 
 
 def generate_numero_bc(annee: int, sequence: int) -> str: